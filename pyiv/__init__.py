@@ -50,6 +50,8 @@ Quick Start:
 For more information, see the individual module documentation.
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 from pyiv.binder import Binder, BindingBuilder
 from pyiv.chain import ChainHandler, ChainType
 from pyiv.clock import Clock, RealClock, SyntheticClock, Timer
@@ -81,9 +83,12 @@ from pyiv.provider import (
 )
 from pyiv.reflection import ReflectionConfig
 from pyiv.scope import GlobalSingletonScope, NoScope, Scope, SingletonScope
-from pyiv.serde import Base64SerDe, JSONSerDe, NoOpSerDe, PickleSerDe, SerDe, XMLSerDe, YAMLSerDe
+from pyiv.serde import SerDe
 from pyiv.singleton import GlobalSingletonRegistry, SingletonType
 
+if TYPE_CHECKING:
+    from pyiv.serde import Base64SerDe, JSONSerDe, NoOpSerDe, PickleSerDe, XMLSerDe, YAMLSerDe
+
 # Command interface (optional import)
 try:
     from pyiv.command import CLICommand, Command, CommandRunner, ServiceCommand
@@ -158,3 +163,31 @@ __all__ = [
 
 if _has_commands:
     __all__.extend(["Command", "ServiceCommand", "CLICommand", "CommandRunner"])
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve pyiv.serde exports (e.g. pyiv.JSONSerDe) through pyiv.serde's own lazy hook.
+
+    Args:
+        name: Attribute name looked up on the package
+
+    Returns:
+        The export of the same name from pyiv.serde
+
+    Raises:
+        AttributeError: If name is not exported by pyiv.serde either
+    """
+    from pyiv import serde
+
+    if name in serde.__all__:
+        value = getattr(serde, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Include pyiv.serde's exports that have not been resolved yet."""
+    from pyiv import serde
+
+    return sorted(set(globals()) | set(serde.__all__))
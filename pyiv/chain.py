@@ -28,6 +28,11 @@ class ChainType(Enum):
     SORTING = "sorting"
     NETWORK_CLIENT = "network_client"
 
+    # Members are singletons compared by identity, so the C-level identity hash is
+    # consistent with equality and avoids Enum.__hash__'s Python-level call on
+    # every (chain_type, ...) registry lookup
+    __hash__ = object.__hash__
+
 
 class ChainHandler(ABC):
     """Abstract base class for chain of responsibility handlers.
@@ -29,6 +29,7 @@ Usage:
         ...         self.register_instance(Cache, my_cache_instance)
 """
 
+import sys
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 from pyiv.binder import Binder, BindingBuilder
@@ -63,14 +64,18 @@ class Config:
         ] = {}
         # Multibindings: Type -> (Set[Type], List[Type], Set[Any], List[Any])
         self._multibindings: Dict[Type, Tuple[Set[Type], List[Type], Set[Any], List[Any]]] = {}
-        # Chain handler registrations: (chain_type, handler_type) -> implementation class
-        self._chain_by_type: Dict[Tuple[ChainType, str], Type[ChainHandler]] = {}
-        # Chain handler registrations: (chain_type, name) -> (implementation class, handler_type)
-        self._chain_by_name: Dict[Tuple[ChainType, str], Tuple[Type[ChainHandler], str]] = {}
+        # Chain handler registrations, each holding everything an injection needs so a
+        # lookup is a single probe:
+        # (chain_type, handler_type) -> (implementation class, singleton_type)
+        self._chain_by_type: Dict[
+            Tuple[ChainType, str], Tuple[Type[ChainHandler], SingletonType]
+        ] = {}
+        # (chain_type, name) -> (implementation class, handler_type, singleton_type)
+        self._chain_by_name: Dict[
+            Tuple[ChainType, str], Tuple[Type[ChainHandler], str, SingletonType]
+        ] = {}
         # Chain handler instances: (chain_type, name) -> instance (for pre-created instances)
         self._chain_instances: Dict[Tuple[ChainType, str], ChainHandler] = {}
-        # Chain handler singleton configuration: (chain_type, name) -> singleton_type
-        self._chain_singleton_types: Dict[Tuple[ChainType, str], SingletonType] = {}
         self.configure()
 
     def configure(self):
@@ -116,16 +121,7 @@ class Config:
         if singleton:
             singleton_type = SingletonType.SINGLETON
 
-        # Convert singleton_type to scope if scope not provided
-        if scope is None and singleton_type != SingletonType.NONE:
-            from pyiv.scope import GlobalSingletonScope, SingletonScope
-
-            if singleton_type == SingletonType.GLOBAL_SINGLETON:
-                scope = GlobalSingletonScope()
-            elif singleton_type == SingletonType.SINGLETON:
-                scope = SingletonScope()
-
-        # Store scope
+        # Store scope (singleton_type is handled by the injector's own singleton caches)
         if scope is not None:
             self._scopes[abstract] = scope
 
@@ -137,15 +133,11 @@ class Config:
                 self._registrations[abstract] = concrete
             return
 
-        # Store singleton type (for backward compatibility)
+        # Store singleton type; the injector picks its lifecycle handling from it
         if singleton_type != SingletonType.NONE:
             self._singleton_types[abstract] = singleton_type
 
-        if singleton_type == SingletonType.SINGLETON and isinstance(concrete, type):
-            # For singleton classes, we'll create an instance on first injection
-            self._instances[abstract] = None  # Placeholder, will be created lazily
-            self._registrations[abstract] = concrete
-        elif not isinstance(concrete, type) and not callable(concrete):
+        if not isinstance(concrete, type) and not callable(concrete):
             # It's an instance
             self._instances[abstract] = concrete
             self._registrations[abstract] = type(concrete)
@@ -227,6 +219,52 @@ class Config:
             handler_class: The chain handler implementation class
             singleton_type: Type of singleton behavior (default: SINGLETON)
 
+        Raises:
+            TypeError: If handler_class is not a subclass of ChainHandler
+            ValueError: If handler_type is empty
+        """
+        self._validate_chain_handler(handler_type, handler_class)
+        # Interned keys match string-literal lookups by identity
+        handler_type = sys.intern(handler_type)
+        self._chain_by_type[(chain_type, handler_type)] = (handler_class, singleton_type)
+
+    def register_chain_handlers(
+        self,
+        handlers: Dict[Tuple[ChainType, str], Type[ChainHandler]],
+        *,
+        singleton_type: SingletonType = SingletonType.SINGLETON,
+    ):
+        """Register several default chain handler implementations at once.
+
+        Equivalent to calling register_chain_handler() for each entry, but every
+        entry is validated before any is registered, so a bad entry leaves the
+        configuration unchanged.
+
+        Args:
+            handlers: Mapping of (chain_type, handler_type) to handler class
+            singleton_type: Type of singleton behavior for all handlers (default: SINGLETON)
+
+        Raises:
+            TypeError: If a handler class is not a subclass of ChainHandler
+            ValueError: If a handler_type is empty
+
+        Example:
+            >>> self.register_chain_handlers({
+            ...     (ChainType.ENCODING, "json"): JSONSerDe,
+            ...     (ChainType.ENCODING, "pickle"): PickleSerDe,
+            ... })
+        """
+        for (_, handler_type), handler_class in handlers.items():
+            self._validate_chain_handler(handler_type, handler_class)
+        self._chain_by_type.update(
+            ((chain_type, sys.intern(handler_type)), (handler_class, singleton_type))
+            for (chain_type, handler_type), handler_class in handlers.items()
+        )
+
+    @staticmethod
+    def _validate_chain_handler(handler_type: str, handler_class: Type[ChainHandler]) -> None:
+        """Check a chain handler registration's handler type and class.
+
         Raises:
             TypeError: If handler_class is not a subclass of ChainHandler
             ValueError: If handler_type is empty
@@ -238,11 +276,6 @@ class Config:
                 f"handler_class must be a subclass of ChainHandler, got {handler_class}"
             )
 
-        key = (chain_type, handler_type)
-        self._chain_by_type[key] = handler_class
-        if singleton_type != SingletonType.NONE:
-            self._chain_singleton_types[key] = singleton_type
-
     def register_chain_handler_by_name(
         self,
         chain_type: ChainType,
@@ -271,17 +304,9 @@ class Config:
         """
         if not isinstance(name, str) or not name:
             raise ValueError(f"name must be a non-empty string, got {name}")
-        if not isinstance(handler_type, str) or not handler_type:
-            raise ValueError(f"handler_type must be a non-empty string, got {handler_type}")
-        if not isinstance(handler_class, type) or not issubclass(handler_class, ChainHandler):
-            raise TypeError(
-                f"handler_class must be a subclass of ChainHandler, got {handler_class}"
-            )
-
-        key = (chain_type, name)
-        self._chain_by_name[key] = (handler_class, handler_type)
-        if singleton_type != SingletonType.NONE:
-            self._chain_singleton_types[key] = singleton_type
+        self._validate_chain_handler(handler_type, handler_class)
+        key = (chain_type, sys.intern(name))
+        self._chain_by_name[key] = (handler_class, sys.intern(handler_type), singleton_type)
 
     def register_chain_handler_instance(
         self, chain_type: ChainType, name: str, instance: ChainHandler
@@ -302,13 +327,12 @@ class Config:
         if not isinstance(instance, ChainHandler):
             raise TypeError(f"instance must be a ChainHandler, got {type(instance)}")
 
-        key = (chain_type, name)
+        key = (chain_type, sys.intern(name))
         self._chain_instances[key] = instance
         # Also register by handler type if not already registered
-        handler_type = instance.handler_type
-        type_key = (chain_type, handler_type)
+        type_key = (chain_type, sys.intern(instance.handler_type))
         if type_key not in self._chain_by_type:
-            self._chain_by_type[type_key] = type(instance)
+            self._chain_by_type[type_key] = (type(instance), SingletonType.NONE)
 
     def get_chain_handler_registration(
         self, chain_type: ChainType, handler_type: str
@@ -322,7 +346,8 @@ class Config:
         Returns:
             The registered chain handler class, or None if not found
         """
-        return self._chain_by_type.get((chain_type, handler_type))
+        entry = self._chain_by_type.get((chain_type, handler_type))
+        return entry[0] if entry is not None else None
 
     def get_chain_handler_registration_by_name(
         self, chain_type: ChainType, name: str
@@ -336,7 +361,8 @@ class Config:
         Returns:
             A tuple of (handler class, handler_type), or None if not found
         """
-        return self._chain_by_name.get((chain_type, name))
+        entry = self._chain_by_name.get((chain_type, name))
+        return entry[:2] if entry is not None else None
 
     def get_chain_handler_instance(
         self, chain_type: ChainType, name: str
@@ -388,7 +414,11 @@ class Config:
             The singleton type, or SingletonType.NONE if not registered or not a singleton
         """
         key = (chain_type, name)
-        return self._chain_singleton_types.get(key, SingletonType.NONE)
+        named = self._chain_by_name.get(key)
+        if named is not None:
+            return named[2]
+        by_type = self._chain_by_type.get(key)
+        return by_type[1] if by_type is not None else SingletonType.NONE
 
     def get_scope(self, abstract: Type) -> Optional[Scope]:
         """Get the scope for a registered type.
@@ -30,6 +30,7 @@ Usage:
 """
 
 import inspect
+import sys
 from typing import (
     Any,
     Callable,
@@ -49,7 +50,7 @@ from pyiv.config import Config
 from pyiv.key import Key
 from pyiv.members import InjectorMembersInjector, MembersInjector
 from pyiv.optional import get_optional_type, is_optional_type
-from pyiv.provider import InjectorProvider, Provider
+from pyiv.provider import FactoryProvider, InjectorProvider, Provider
 from pyiv.scope import GlobalSingletonScope, NoScope, Scope, SingletonScope
 from pyiv.singleton import GlobalSingletonRegistry, SingletonType
 
@@ -65,7 +66,10 @@ class Injector:
         """
         self._config = config
         self._singletons: Dict[Type, Any] = {}
+        # Per-injector chain handler singletons, keyed by handler type and by name.
+        # Kept apart so a name never resolves to the handler cached for a same-named type.
         self._chain_singletons: Dict[Tuple[ChainType, str], ChainHandler] = {}
+        self._named_chain_singletons: Dict[Tuple[ChainType, str], ChainHandler] = {}
         self._scoped_instances: Dict[Scope, Dict[Any, Any]] = {}
 
     def inject(self, cls_or_key: Union[Type, Key[Any]], **kwargs) -> Any:
@@ -98,63 +102,86 @@ class Injector:
         if scope is not None and not isinstance(scope, NoScope):
             return self._inject_scoped(cls, scope, **kwargs)
 
-        # Fall back to singleton type (backward compatibility)
+        # Dispatch on the registration's singleton type
         singleton_type = self._config.get_singleton_type(cls)
+        return getattr(self, self._inject_by_singleton_type[singleton_type])(cls, kwargs)
 
-        # Handle global singleton
-        if singleton_type == SingletonType.GLOBAL_SINGLETON:
-            instance = GlobalSingletonRegistry.get(cls)
-            if instance is not None:
-                return instance
-            # Create new instance and store globally
-            concrete = self._config.get_registration(cls)
-            if concrete is None:
-                instance = self._instantiate(cls, **kwargs)
-            else:
-                instance = self._instantiate(concrete, **kwargs)
-            GlobalSingletonRegistry.set(cls, instance)
-            return instance
+    def _inject_new(self, cls: Type, kwargs: Dict[str, Any]) -> Any:
+        """Inject a dependency registered without singleton behavior.
+
+        Args:
+            cls: The class to inject
+            kwargs: Keyword arguments for the constructor
 
-        # Check if we have a registered singleton instance
+        Returns:
+            The registered instance, or a new instance
+        """
         instance = self._config.get_instance(cls)
         if instance is not None:
             return instance
+        return self._create(cls, kwargs)
 
-        # Check if we have a cached per-injector singleton
-        if singleton_type == SingletonType.SINGLETON and cls in self._singletons:
-            return self._singletons[cls]
+    def _inject_singleton(self, cls: Type, kwargs: Dict[str, Any]) -> Any:
+        """Inject a per-injector singleton.
 
-        # Get the concrete implementation
-        concrete = self._config.get_registration(cls)
+        The first call creates the instance (with that call's kwargs); later
+        calls return it. If two threads race to create it, both get the
+        instance stored first.
 
-        if concrete is None:
-            # No registration, try to instantiate the class directly
-            # (useful for concrete classes that don't need registration)
-            instance = self._instantiate(cls, **kwargs)
-            # Store as singleton if configured
-            if singleton_type == SingletonType.SINGLETON:
-                self._singletons[cls] = instance
+        Args:
+            cls: The class to inject
+            kwargs: Keyword arguments for the constructor
+
+        Returns:
+            The injector's instance for the class
+        """
+        instance = self._singletons.get(cls)
+        if instance is not None:
             return instance
+        instance = self._config.get_instance(cls)
+        if instance is None:
+            instance = self._create(cls, kwargs)
+        return self._singletons.setdefault(cls, instance)
+
+    def _inject_global_singleton(self, cls: Type, kwargs: Dict[str, Any]) -> Any:
+        """Inject a singleton shared by all injectors.
 
-        # Check if it's a lazy singleton registration (old style)
-        if cls in self._config._instances and self._config._instances[cls] is None:
-            # Lazy singleton creation
-            instance = self._instantiate(concrete, **kwargs)
-            self._singletons[cls] = instance
-            self._config._instances[cls] = instance
+        Args:
+            cls: The class to inject
+            kwargs: Keyword arguments for the constructor
+
+        Returns:
+            The process-wide instance for the class
+        """
+        instance = GlobalSingletonRegistry.get(cls)
+        if instance is not None:
             return instance
+        instance = self._config.get_instance(cls)
+        if instance is None:
+            instance = self._create(cls, kwargs)
+        return GlobalSingletonRegistry.setdefault(cls, instance)
 
-        # Instantiate the concrete implementation
-        instance = self._instantiate(concrete, **kwargs)
+    # Names of the inject() handlers, chosen by the registration's singleton type.
+    # Looked up on the instance so subclasses can override the handlers.
+    _inject_by_singleton_type: Dict[SingletonType, str] = {
+        SingletonType.NONE: "_inject_new",
+        SingletonType.SINGLETON: "_inject_singleton",
+        SingletonType.GLOBAL_SINGLETON: "_inject_global_singleton",
+    }
 
-        # Store as singleton if configured
-        if singleton_type == SingletonType.SINGLETON:
-            self._singletons[cls] = instance
-        elif cls in self._config._instances:
-            # Old-style singleton caching
-            self._singletons[cls] = instance
+    def _create(self, cls: Type, kwargs: Dict[str, Any]) -> Any:
+        """Create a new instance of a class's registered implementation.
 
-        return instance
+        Args:
+            cls: The class to inject
+            kwargs: Keyword arguments for the constructor
+
+        Returns:
+            A new instance of the registered concrete class (or factory result),
+            or of cls itself when it has no registration
+        """
+        concrete = self._config.get_registration(cls)
+        return self._instantiate(cls if concrete is None else concrete, **kwargs)
 
     def _inject_key(self, key: Key[Any], **kwargs) -> Any:
         """Inject using a qualified key.
@@ -207,8 +234,8 @@ class Injector:
         if cls in scope_cache:
             return scope_cache[cls]
 
-        # Create provider
-        provider = InjectorProvider(cls, self)
+        # Create instances directly: going through inject() would find the scope again
+        provider = FactoryProvider(lambda: self._create(cls, kwargs))
 
         # Apply scope - convert cls to Key type for scope
         scope_key: Union[Type, str, tuple] = cls
@@ -405,16 +432,19 @@ class Injector:
             raise TypeError(f"interface must be a type, got {type(interface)}")
 
         # Check if config supports reflection-based discovery
-        if not hasattr(self._config, "discover_implementations"):
+        if not hasattr(self._config, "get_implementation") or not hasattr(
+            self._config, "discover_implementations"
+        ):
             raise ValueError(
                 f"Config {type(self._config).__name__} does not support reflection-based discovery. "
                 "Use ReflectionConfig for inject_by_name() support."
             )
 
-        # Get discovered implementations
-        implementations = self._config.discover_implementations(interface)
+        # Look the name up in the config's cached discovery result
+        implementation = self._config.get_implementation(interface, name)
 
-        if name not in implementations:
+        if implementation is None:
+            implementations = self._config.discover_implementations(interface)
             available = ", ".join(sorted(implementations.keys())) or "none"
             raise ValueError(
                 f"No implementation '{name}' found for {interface.__name__}. "
@@ -423,7 +453,7 @@ class Injector:
 
         # Return the class (not instance)
         # The caller will use inject() which respects singleton configuration
-        return implementations[name]
+        return implementation
 
     def inject_chain_handler(self, chain_type: ChainType, handler_type: str) -> ChainHandler:
         """Inject a chain handler instance by handler type.
@@ -446,14 +476,20 @@ class Injector:
             >>> json_serde = injector.inject_chain_handler(ChainType.ENCODING, "json")
             >>> data = json_serde.serialize({"key": "value"})
         """
+        # Fast path: a per-injector singleton that was already created
+        cache_key = (chain_type, handler_type)
+        instance = self._chain_singletons.get(cache_key)
+        if instance is not None:
+            return instance
+
         # Check for pre-registered instance
         instance = self._config.get_chain_handler_instance(chain_type, handler_type)
         if instance is not None:
             return instance
 
-        # Get the registered class
-        handler_class = self._config.get_chain_handler_registration(chain_type, handler_type)
-        if handler_class is None:
+        # Get the registered class and its singleton configuration in one lookup
+        registration = self._config._chain_by_type.get(cache_key)
+        if registration is None:
             # Get available handler types for this chain type
             available = []
             for (ct, ht), _ in self._config._chain_by_type.items():
@@ -465,8 +501,7 @@ class Injector:
                 f"Available types: {available_str}"
             )
 
-        # Check singleton configuration
-        singleton_type = self._config.get_chain_handler_singleton_type(chain_type, handler_type)
+        handler_class, singleton_type = registration
 
         # Handle global singleton
         if singleton_type == SingletonType.GLOBAL_SINGLETON:
@@ -476,21 +511,14 @@ class Injector:
                 return instance
             # Create new instance
             instance = self._instantiate(handler_class)
-            GlobalSingletonRegistry.set(key, instance)
-            return instance
-
-        # Check if we have a cached per-injector singleton
-        cache_key = (chain_type, handler_type)
-        if singleton_type == SingletonType.SINGLETON and cache_key in self._chain_singletons:
-            return self._chain_singletons[cache_key]
+            return GlobalSingletonRegistry.setdefault(key, instance)
 
         # Create instance
         instance = self._instantiate(handler_class)
 
         # Store as singleton if configured
         if singleton_type == SingletonType.SINGLETON:
-            self._chain_singletons[cache_key] = instance
-
+            return self._chain_singletons.setdefault(cache_key, instance)
         return instance
 
     def inject_chain_handler_by_name(self, chain_type: ChainType, name: str) -> ChainHandler:
@@ -515,13 +543,19 @@ class Injector:
             >>> input_serde = injector.inject_chain_handler_by_name(ChainType.ENCODING, "json-input")
             >>> output_serde = injector.inject_chain_handler_by_name(ChainType.ENCODING, "json-output")
         """
+        # Fast path: a per-injector singleton that was already created
+        cache_key = (chain_type, name)
+        instance = self._named_chain_singletons.get(cache_key)
+        if instance is not None:
+            return instance
+
         # Check for pre-registered instance
         instance = self._config.get_chain_handler_instance(chain_type, name)
         if instance is not None:
             return instance
 
-        # Get the registered class and handler type
-        registration = self._config.get_chain_handler_registration_by_name(chain_type, name)
+        # Get the registered class, handler type and singleton configuration in one lookup
+        registration = self._config._chain_by_name.get(cache_key)
         if registration is None:
             # Get available names for this chain type
             available = []
@@ -537,10 +571,7 @@ class Injector:
                 f"Available names: {available_str}"
             )
 
-        handler_class, handler_type = registration
-
-        # Check singleton configuration
-        singleton_type = self._config.get_chain_handler_singleton_type(chain_type, name)
+        handler_class, handler_type, singleton_type = registration
 
         # Handle global singleton
         if singleton_type == SingletonType.GLOBAL_SINGLETON:
@@ -550,23 +581,37 @@ class Injector:
                 return instance
             # Create new instance
             instance = self._instantiate(handler_class)
-            GlobalSingletonRegistry.set(key, instance)
-            return instance
-
-        # Check if we have a cached per-injector singleton
-        cache_key = (chain_type, name)
-        if singleton_type == SingletonType.SINGLETON and cache_key in self._chain_singletons:
-            return self._chain_singletons[cache_key]
+            return GlobalSingletonRegistry.setdefault(key, instance)
 
         # Create instance
         instance = self._instantiate(handler_class)
 
         # Store as singleton if configured
         if singleton_type == SingletonType.SINGLETON:
-            self._chain_singletons[cache_key] = instance
-
+            return self._named_chain_singletons.setdefault(cache_key, instance)
         return instance
 
+    def warm_chain_handlers(self) -> None:
+        """Create every singleton chain handler registered in the config.
+
+        Instantiates the SINGLETON and GLOBAL_SINGLETON chain handlers up front,
+        so the first inject_chain_handler() or inject_chain_handler_by_name()
+        call for each is a cache hit instead of paying for construction.
+        Handlers registered with SingletonType.NONE are left alone.
+
+        Example:
+            >>> injector = get_injector(MyConfig)
+            >>> injector.warm_chain_handlers()  # e.g. at application startup
+        """
+        for (chain_type, handler_type), (_, singleton_type) in list(
+            self._config._chain_by_type.items()
+        ):
+            if singleton_type != SingletonType.NONE:
+                self.inject_chain_handler(chain_type, handler_type)
+        for (chain_type, name), (_, _, singleton_type) in list(self._config._chain_by_name.items()):
+            if singleton_type != SingletonType.NONE:
+                self.inject_chain_handler_by_name(chain_type, name)
+
     def inject_members(self, instance: Any) -> None:
         """Inject dependencies into an existing instance.
 
@@ -644,11 +689,15 @@ class Injector:
         return None
 
 
-def get_injector(config: Union[Type[Config], Config]) -> Injector:
+def get_injector(
+    config: Union[Type[Config], Config], *, warm_chain_handlers: bool = False
+) -> Injector:
     """Create an injector from a configuration class or instance.
 
     Args:
         config: A Config subclass or Config instance that defines dependencies
+        warm_chain_handlers: If True, create the singleton chain handlers up front
+            (see Injector.warm_chain_handlers())
 
     Returns:
         An Injector instance configured with the given config
@@ -669,10 +718,13 @@ def get_injector(config: Union[Type[Config], Config]) -> Injector:
     """
     if isinstance(config, Config):
         # Already an instance, use it directly
-        return Injector(config)
+        injector = Injector(config)
     elif isinstance(config, type) and issubclass(config, Config):
         # It's a class, instantiate it
         config_instance = config()
-        return Injector(config_instance)
+        injector = Injector(config_instance)
     else:
         raise TypeError(f"config must be a Config subclass or Config instance, got {type(config)}")
+    if warm_chain_handlers:
+        injector.warm_chain_handlers()
+    return injector
@@ -7,13 +7,63 @@ in Python packages using reflection, eliminating the need for manual registratio
 import fnmatch
 import importlib
 import inspect
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+import mmap
+import pkgutil
+import re
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Type
 
 from pyiv.config import Config
 from pyiv.singleton import SingletonType
 
 
+def _pattern_literals(pattern: Optional[str]) -> Tuple[bytes, ...]:
+    """Extract the literal fragments of an fnmatch pattern.
+
+    Any class whose name matches the pattern must contain every fragment,
+    so a module source lacking one cannot define a matching class.
+
+    Args:
+        pattern: fnmatch-style pattern (e.g., "*Handler"), or None
+
+    Returns:
+        Tuple of non-empty literal fragments encoded as UTF-8
+    """
+    if not pattern:
+        return ()
+    fragments = re.split(r"\*|\?|\[[^\]]*\]", pattern)
+    return tuple(fragment.encode("utf-8") for fragment in fragments if fragment)
+
+
+def _source_may_define(origin: Optional[str], markers: Tuple[bytes, ...]) -> bool:
+    """Cheaply check whether a module source file could define a matching class.
+
+    The file is memory-mapped and searched for every pattern fragment before
+    paying for the import. Only name fragments are checked, not class
+    statements, since classes can also be created by calls such as type(),
+    make_dataclass() or NamedTuple(). Anything that is not a plain .py source
+    file is assumed to match.
+
+    Args:
+        origin: Path of the module source (spec.origin)
+        markers: Byte strings that must all appear in the source
+
+    Returns:
+        False only if the source provably contains no candidate class
+    """
+    if origin is None or not origin.endswith(".py"):
+        return True
+    try:
+        with open(origin, "rb") as source_file:
+            if source_file.seek(0, 2) == 0:
+                return False
+            with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                return all(source.find(marker) != -1 for marker in markers)
+    except (OSError, ValueError):
+        return True
+
+
 class ReflectionConfig(Config):
     """Configuration class that supports module-based discovery of implementations.
 
@@ -36,8 +86,14 @@ class ReflectionConfig(Config):
 
     def __init__(self):
         """Initialize the reflection configuration."""
-        super().__init__()
+        # Set up discovery state first: Config.__init__ runs configure(), which
+        # typically calls register_module()
         self._module_registrations: Dict[Type, Dict[str, Any]] = {}
+        # Discovery results per interface, filled on first discovery
+        self._discovered_cache: Dict[Type, Dict[str, Type]] = {}
+        # Classes defined in each scanned module, shared by every interface's discovery
+        self._module_classes: Dict[str, Tuple[ModuleType, List[Tuple[str, Type]]]] = {}
+        super().__init__()
 
     def register_module(
         self,
@@ -83,9 +139,13 @@ class ReflectionConfig(Config):
         self._module_registrations[interface] = {
             "package": package_path,
             "pattern": pattern,
+            # Translate the glob once here rather than once per candidate class
+            "compiled_pattern": re.compile(fnmatch.translate(pattern)) if pattern else None,
+            "source_markers": _pattern_literals(pattern),
             "recursive": recursive,
             "singleton_type": singleton_type,
         }
+        self._discovered_cache.pop(interface, None)
 
         # Trigger discovery and registration immediately
         # This ensures implementations are available when injector is created
@@ -99,6 +159,10 @@ class ReflectionConfig(Config):
         optionally submodules) are discovered - no discovery happens outside
         the registered package boundaries.
 
+        Results are cached per interface until register_module() is called
+        again for it, so repeated lookups do not re-walk the package. Each call
+        returns a new copy of the cached dictionary, which callers may modify.
+
         Args:
             interface: The interface to discover implementations for
 
@@ -110,6 +174,42 @@ class ReflectionConfig(Config):
             ValueError: If no module registration exists for the interface
             ImportError: If the package cannot be imported
         """
+        return dict(self._discovered(interface))
+
+    def get_implementation(self, interface: Type, name: str) -> Optional[Type]:
+        """Look up a single discovered implementation by name.
+
+        Reads the cached discovery result directly, without the copy that
+        discover_implementations() makes, discovering first if needed.
+
+        Args:
+            interface: The interface to look up an implementation of
+            name: Implementation name (e.g., "CreateHandler" or "handlers.CreateHandler")
+
+        Returns:
+            The implementation class, or None if no implementation has that name
+
+        Raises:
+            ImportError: If the package cannot be imported
+        """
+        return self._discovered(interface).get(name)
+
+    def _discovered(self, interface: Type) -> Dict[str, Type]:
+        """Return the cached discovery result for an interface, discovering on a miss.
+
+        Args:
+            interface: The interface to discover implementations for
+
+        Returns:
+            The cached dictionary mapping implementation names to classes (not a copy)
+
+        Raises:
+            ImportError: If the package cannot be imported
+        """
+        cached = self._discovered_cache.get(interface)
+        if cached is not None:
+            return cached
+
         if interface not in self._module_registrations:
             return {}
 
@@ -125,10 +225,11 @@ class ReflectionConfig(Config):
 
         implementations = {}
 
-        # Scan the main module for implementations
-        for name, obj in inspect.getmembers(package):
-            if self._is_implementation(obj, interface, reg["pattern"], package_path):
-                implementations[name] = obj
+        # Scan the main module for implementations. Keys are interned so lookups by
+        # name (e.g. inject_by_name) hit on identity rather than comparing strings.
+        for name, obj in self._classes_defined_in(package):
+            if self._is_implementation(obj, interface, reg["compiled_pattern"], package_path):
+                implementations[sys.intern(name)] = obj
 
         # Recursively scan submodules if requested
         if reg["recursive"]:
@@ -136,6 +237,7 @@ class ReflectionConfig(Config):
                 package, package_path, interface, reg, implementations, package_path
             )
 
+        self._discovered_cache[interface] = implementations
         return implementations
 
     def _discover_and_register(self, interface: Type):
@@ -156,11 +258,38 @@ class ReflectionConfig(Config):
             # This enables inject() and inject_by_name() to work
             self.register(interface, impl_class, singleton_type=singleton_type)
 
+    def _classes_defined_in(self, module: ModuleType) -> List[Tuple[str, Type]]:
+        """Get the classes a module defines itself, sorted by attribute name.
+
+        Imported classes can never be discovered from a module (see
+        _is_in_module()), so they are dropped here once. The list is cached per
+        module object and shared by every interface registered over the module,
+        leaving only the per-interface checks for repeated discoveries.
+
+        Args:
+            module: The module to enumerate
+
+        Returns:
+            List of (attribute name, class) tuples, in inspect.getmembers() order
+        """
+        module_name = module.__name__
+        cached = self._module_classes.get(module_name)
+        if cached is not None and cached[0] is module:
+            return cached[1]
+
+        classes = [
+            (name, obj)
+            for name, obj in sorted(vars(module).items())
+            if isinstance(obj, type) and getattr(obj, "__module__", None) == module_name
+        ]
+        self._module_classes[module_name] = (module, classes)
+        return classes
+
     def _is_implementation(
         self,
         obj: Any,
         interface: Type,
-        pattern: Optional[str],
+        pattern: Optional[Pattern[str]],
         current_module_path: Optional[str] = None,
     ) -> bool:
         """Check if an object implements the interface.
@@ -168,7 +297,7 @@ class ReflectionConfig(Config):
         Args:
             obj: The object to check (class, function, etc.)
             interface: The interface to check against
-            pattern: Optional name pattern to match
+            pattern: Optional compiled name pattern to match
             current_module_path: The module path currently being scanned (for validation)
 
         Returns:
@@ -178,19 +307,21 @@ class ReflectionConfig(Config):
         if not inspect.isclass(obj):
             return False
 
-        # Must implement the interface (but not be the interface itself)
-        if not issubclass(obj, interface) or obj == interface:
+        # Must be defined in the current module being scanned (not imported from elsewhere)
+        # This ensures we only discover implementations that are actually defined in
+        # the module being scanned, preventing duplicates when classes are re-exported.
+        # Checked first: a string compare is cheaper than the subclass check below.
+        if not self._is_in_module(obj, current_module_path, interface):
             return False
 
         # Check name pattern if provided
-        if pattern:
+        if pattern is not None:
             if not self._matches_pattern(obj.__name__, pattern):
                 return False
 
-        # Must be defined in the current module being scanned (not imported from elsewhere)
-        # This ensures we only discover implementations that are actually defined in
-        # the module being scanned, preventing duplicates when classes are re-exported
-        if not self._is_in_module(obj, current_module_path, interface):
+        # Must implement the interface (but not be the interface itself). Last, as
+        # the subclass check is the most expensive test.
+        if obj is interface or not issubclass(obj, interface):
             return False
 
         return True
@@ -266,7 +397,7 @@ class ReflectionConfig(Config):
         if root_package_path is None:
             root_package_path = package_path
 
-        submodules = self._get_submodules(package, package_path)
+        submodules = self._get_submodules(package, package_path, reg["source_markers"])
         for submodule_name, submodule in submodules.items():
             # Build full path from root for this submodule
             full_submodule_path = f"{package_path}.{submodule_name}"
@@ -277,12 +408,13 @@ class ReflectionConfig(Config):
                 relative_path = submodule_name
 
             # Scan this submodule for implementations
-            for name, obj in inspect.getmembers(submodule):
-                if self._is_implementation(obj, interface, reg["pattern"], full_submodule_path):
+            pattern = reg["compiled_pattern"]
+            for name, obj in self._classes_defined_in(submodule):
+                if self._is_implementation(obj, interface, pattern, full_submodule_path):
                     # Use full path from root package to avoid collisions
                     # e.g., "pkg.mod.ClassA" vs "pkg.sub.mod.ClassA"
                     full_name = f"{relative_path}.{name}" if relative_path else name
-                    implementations[full_name] = obj
+                    implementations[sys.intern(full_name)] = obj
 
             # Recursively scan nested submodules
             self._scan_submodules_recursive(
@@ -294,51 +426,41 @@ class ReflectionConfig(Config):
                 root_package_path,
             )
 
-    def _get_submodules(self, package: Any, package_path: str) -> Dict[str, Any]:
+    def _get_submodules(
+        self, package: Any, package_path: str, source_markers: Tuple[bytes, ...] = ()
+    ) -> Dict[str, Any]:
         """Get all submodules of a package.
 
+        Subpackages are always imported so their own submodules can be
+        scanned. Plain modules that are not imported yet are only imported
+        when their source could define a matching class (see
+        _source_may_define()); modules skipped this way are never executed.
+
         Args:
             package: The package module to scan
             package_path: The package path string
+            source_markers: Byte strings a module source must contain to be imported
 
         Returns:
             Dictionary mapping submodule names to module objects
         """
         submodules: Dict[str, Any] = {}
 
-        # Get the package's directory path
-        package_file = getattr(package, "__file__", None)
-        if package_file is None:
+        # Only packages have submodules
+        search_path = getattr(package, "__path__", None)
+        if not search_path:
             return submodules
 
-        package_dir = Path(package_file).parent
-
-        # Scan for Python files in the package directory
-        for py_file in package_dir.glob("*.py"):
-            if py_file.name == "__init__.py":
-                continue
-
-            module_name = py_file.stem
+        for module_info in pkgutil.iter_modules(search_path):
+            module_name = module_info.name
             submodule_path = f"{package_path}.{module_name}"
 
-            try:
-                submodule = importlib.import_module(submodule_path)
-                submodules[module_name] = submodule
-            except ImportError:
-                # Skip modules that can't be imported
-                continue
-
-        # Also check for subdirectories with __init__.py
-        for subdir in package_dir.iterdir():
-            if not subdir.is_dir():
-                continue
-
-            init_file = subdir / "__init__.py"
-            if not init_file.exists():
-                continue
-
-            module_name = subdir.name
-            submodule_path = f"{package_path}.{module_name}"
+            if not module_info.ispkg and submodule_path not in sys.modules:
+                # zipimporter has no find_spec() before Python 3.10; import those unfiltered
+                find_spec = getattr(module_info.module_finder, "find_spec", None)
+                spec = find_spec(submodule_path) if find_spec is not None else None
+                if spec is not None and not _source_may_define(spec.origin, source_markers):
+                    continue
 
             try:
                 submodule = importlib.import_module(submodule_path)
@@ -349,14 +471,14 @@ class ReflectionConfig(Config):
 
         return submodules
 
-    def _matches_pattern(self, name: str, pattern: str) -> bool:
-        """Check if a name matches a pattern using fnmatch syntax.
+    def _matches_pattern(self, name: str, pattern: Pattern[str]) -> bool:
+        """Check if a name matches a compiled fnmatch-style pattern.
 
         Args:
             name: The name to check
-            pattern: The pattern to match against (supports * wildcard)
+            pattern: The pattern compiled from fnmatch syntax by register_module()
 
         Returns:
             True if the name matches the pattern, False otherwise
         """
-        return fnmatch.fnmatch(name, pattern)
+        return pattern.match(name) is not None
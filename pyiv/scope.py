@@ -240,7 +240,8 @@ class GlobalSingletonScope:
         ...         self.register(Cache, RedisCache, scope=GlobalSingletonScope())
     """
 
-    _lock = threading.Lock()
+    # Reentrant: creating one global singleton may inject another
+    _lock = threading.RLock()
     _instances: Dict[Key, Any] = {}
 
     def scope(self, key: Key, provider: Provider[Any]) -> Provider[Any]:
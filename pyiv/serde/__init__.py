@@ -8,6 +8,7 @@ standard library.
 Architecture:
     - SerDe: Base abstract class extending ChainHandler for ENCODING chain type
     - Standard encodings: JSON, Base64, XML, YAML (if available), Pickle, NoOp
+    - Composite encodings: JSON wrapped in base64 ("json-b64")
     - DI Integration: Register and inject SerDe instances via chain system
 
 Usage:
@@ -31,8 +32,33 @@ Usage:
         >>> input_serde = injector.inject_chain_handler_by_name(ChainType.ENCODING, "json-input")
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from pyiv.serde.base import SerDe
-from pyiv.serde.encodings import Base64SerDe, JSONSerDe, NoOpSerDe, PickleSerDe, XMLSerDe, YAMLSerDe
+
+if TYPE_CHECKING:
+    from pyiv.serde.composite import JSONBase64SerDe
+    from pyiv.serde.encodings import (
+        Base64SerDe,
+        JSONSerDe,
+        NoOpSerDe,
+        PickleSerDe,
+        XMLSerDe,
+        YAMLSerDe,
+    )
+
+# Implementations are imported on first access (PEP 562), so importing pyiv.serde
+# does not load the encoding backends (json, pickle, XML, orjson, ...) until needed
+_LAZY_IMPORTS: Dict[str, str] = {
+    "JSONSerDe": "pyiv.serde.encodings",
+    "Base64SerDe": "pyiv.serde.encodings",
+    "XMLSerDe": "pyiv.serde.encodings",
+    "YAMLSerDe": "pyiv.serde.encodings",
+    "PickleSerDe": "pyiv.serde.encodings",
+    "NoOpSerDe": "pyiv.serde.encodings",
+    "JSONBase64SerDe": "pyiv.serde.composite",
+}
 
 __all__ = [
     "SerDe",
@@ -42,4 +68,31 @@ __all__ = [
     "YAMLSerDe",
     "PickleSerDe",
     "NoOpSerDe",
+    "JSONBase64SerDe",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import SerDe implementations on first access.
+
+    Args:
+        name: Attribute name looked up on the package
+
+    Returns:
+        The requested SerDe class
+
+    Raises:
+        AttributeError: If name is not a SerDe exported by this package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the package attributes, including not yet imported SerDes."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
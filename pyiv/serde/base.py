@@ -22,19 +22,19 @@ class SerDe(ChainHandler):
     encoding formats (JSON, base64, YAML, XML, pickle, etc.).
 
     Subclasses must implement:
-        - handler_type: Return the encoding type identifier (e.g., "json", "base64", "pickle")
+        - handler_type: The encoding type identifier (e.g., "json", "base64", "pickle")
         - serialize(): Convert a Python object to encoded bytes/string
         - deserialize(): Convert encoded bytes/string back to a Python object
 
-    The handler_type property identifies the format (e.g., "json", "base64", "pickle").
-    Multiple implementations of the same handler_type can exist with different
-    behaviors (e.g., date formatting, null handling, etc.).
+    The handler_type identifies the format (e.g., "json", "base64", "pickle").
+    Implementations usually set it as a class attribute, which is cheaper to read
+    than a property; a property still works. Multiple implementations of the same
+    handler_type can exist with different behaviors (e.g., date formatting, null
+    handling, etc.).
 
     Example:
         >>> class MyJSONSerDe(SerDe):
-        ...     @property
-        ...     def handler_type(self) -> str:
-        ...         return "json"
+        ...     handler_type = "json"
         ...
         ...     def serialize(self, obj: Any) -> str:
         ...         import json
@@ -45,14 +45,8 @@ class SerDe(ChainHandler):
         ...         return json.loads(data)
     """
 
-    @property
-    def chain_type(self) -> ChainType:
-        """Return the chain type (always ENCODING for SerDe).
-
-        Returns:
-            ChainType.ENCODING
-        """
-        return ChainType.ENCODING
+    #: Chain type (always ENCODING for SerDe)
+    chain_type = ChainType.ENCODING
 
     @property
     @abstractmethod
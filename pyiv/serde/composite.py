@@ -0,0 +1,67 @@
+"""Composite SerDe implementations.
+
+This module provides SerDes that apply more than one encoding in a single
+handler, so the intermediate representation never round-trips through a
+Python string between the steps:
+    - JSONBase64: JSON encoding wrapped in base64 ("json-b64")
+
+Usage:
+    >>> from pyiv.serde import JSONBase64SerDe
+    >>> serde = JSONBase64SerDe()
+    >>> data = serde.serialize({"key": "value"})
+    >>> result = serde.deserialize(data)
+
+    Or register it as a chain handler:
+        >>> self.register_chain_handler(ChainType.ENCODING, "json-b64", JSONBase64SerDe)
+"""
+
+from typing import Any, Optional, Type, TypeVar, Union
+
+from pyiv.serde.base import SerDe
+from pyiv.serde.encodings import Base64SerDe, JSONSerDe
+
+T = TypeVar("T")
+
+
+class JSONBase64SerDe(SerDe):
+    """JSON SerDe whose output is base64 encoded.
+
+    Equivalent to chaining JSONSerDe and Base64SerDe, but the JSON encoder's
+    UTF-8 bytes are base64-encoded directly instead of being decoded to a
+    string and re-encoded first. Pass a JSONSerDe subclass instance to
+    customize the JSON step (e.g. date formatting).
+    """
+
+    handler_type = "json-b64"
+
+    def __init__(self, json_serde: Optional[JSONSerDe] = None):
+        """Initialize the composite SerDe.
+
+        Args:
+            json_serde: SerDe used for the JSON step (default: a new JSONSerDe)
+        """
+        self._json_serde = json_serde if json_serde is not None else JSONSerDe()
+        self._base64_serde = Base64SerDe()
+
+    def serialize(self, obj: Any) -> str:
+        """Serialize to JSON and base64-encode the result.
+
+        Args:
+            obj: The Python object to serialize
+
+        Returns:
+            Base64-encoded JSON string
+        """
+        return self._base64_serde.serialize(self._json_serde.serialize_bytes(obj))
+
+    def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
+        """Base64-decode and deserialize JSON back to a Python object.
+
+        Args:
+            data: The base64-encoded JSON string or bytes
+            target_type: Optional type hint for the expected result type
+
+        Returns:
+            Deserialized Python object
+        """
+        return self._json_serde.deserialize(self._base64_serde.deserialize(data), target_type)
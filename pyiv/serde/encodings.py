@@ -2,48 +2,158 @@
 
 This module provides SerDe implementations for encoding formats available
 in Python's standard library:
-    - JSON: Standard JSON encoding
-    - Base64: Base64 encoding
+    - JSON: Standard JSON encoding (backed by orjson when installed)
+    - Base64: Base64 encoding (backed by pybase64 when installed)
     - YAML: YAML encoding (if available)
-    - XML: XML encoding
+    - XML: XML encoding (backed by lxml when installed)
     - Pickle: Python pickle encoding (default/no-op fallback)
     - NoOp: No-op encoding (pass-through)
 """
 
 import base64
+import importlib.util
 import io
 import json
+import math
 import pickle
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union
+from xml.sax.saxutils import escape as xml_escape
 
-# Try to import yaml (not in standard library, but commonly available)
+# Try to import orjson (optional, compiled JSON encoder/decoder)
 try:
-    import yaml  # type: ignore[import-untyped]
+    import orjson
 
-    YAML_AVAILABLE = True
+    ORJSON_AVAILABLE = True
+    # Hand dataclasses to _default_serializer like the json module does, and
+    # stringify non-str dict keys as json.dumps does
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    _ORJSON_PASSTHROUGH_DATETIME = orjson.OPT_PASSTHROUGH_DATETIME
 except ImportError:
-    YAML_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+    _ORJSON_OPTIONS = _ORJSON_PASSTHROUGH_DATETIME = 0
+
+# JSON encoder and decoder, picked once at import: orjson's when it is installed,
+# the json module's otherwise
+_json_dumps: Callable[..., Any]
+_json_loads: Callable[..., Any]
+if ORJSON_AVAILABLE:
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+else:
+    _json_dumps, _json_loads = json.dumps, json.loads
+
+# Try to import pybase64 (optional, SIMD-accelerated drop-in for base64)
+try:
+    import pybase64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# Try to import lxml (optional, libxml2-backed ElementTree implementation)
+try:
+    from lxml import etree as lxml_etree  # type: ignore[import-untyped]
+
+    LXML_AVAILABLE = True
+    # Built once and shared; like ElementTree, do not expand entities or keep comments/PIs
+    _LXML_PARSER = lxml_etree.XMLParser(
+        resolve_entities=False, no_network=True, remove_comments=True, remove_pis=True
+    )
+except ImportError:
+    LXML_AVAILABLE = False
+
+# PyYAML is not in the standard library, but commonly available. It is slow to
+# import, so only check that it is installed here and import it on first use.
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
+_yaml_module: Any = None
+
+
+def _yaml() -> Any:
+    """Import PyYAML on first use.
+
+    Returns:
+        The yaml module
+
+    Raises:
+        ImportError: If PyYAML is not available
+    """
+    global _yaml_module
+    if _yaml_module is None:
+        if not YAML_AVAILABLE:
+            raise ImportError("PyYAML is not installed. Install it with: pip install pyyaml")
+        import yaml  # type: ignore[import-untyped]
+
+        _yaml_module = yaml
+    return _yaml_module
+
 
 from pyiv.serde.base import SerDe
 
 T = TypeVar("T")
 
 
+def _b64encode(data: bytes) -> str:
+    """Base64-encode bytes to a string, with pybase64 when available.
+
+    Args:
+        data: Bytes to encode
+
+    Returns:
+        Base64-encoded string
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _b64decode(data: bytes) -> bytes:
+    """Decode base64 bytes, with pybase64 when available.
+
+    Args:
+        data: Base64-encoded bytes
+
+    Returns:
+        Decoded bytes
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(data, validate=False)
+    return base64.b64decode(data)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether a payload holds a NaN or infinite float.
+
+    Only dicts, lists and tuples are walked; values that are converted by
+    _default_serializer() are not inspected.
+
+    Args:
+        obj: The Python object to serialize
+
+    Returns:
+        True if a float leaf is NaN or infinite
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is float:
+            if not math.isfinite(item):
+                return True
+        elif item_type is dict:
+            stack.extend(item.values())
+        elif item_type is list or item_type is tuple:
+            stack.extend(item)
+    return False
+
+
 class NoOpSerDe(SerDe):
     """No-op SerDe that passes through data unchanged.
 
     This is the default fallback when no encoding is specified.
     """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
-
-        Returns:
-            The handler type identifier ("noop")
-        """
-        return "noop"
+    handler_type = "noop"
 
     def serialize(self, obj: Any) -> Union[str, bytes]:
         """Pass through the object unchanged.
@@ -76,54 +186,100 @@ class PickleSerDe(SerDe):
 
     Uses Python's pickle module for serialization. This is a fallback option
     when other encodings are not suitable.
+
+    Pickles are written with the highest protocol available (protocol 5 on
+    Python 3.8+), which supports out-of-band buffers: pass a list as
+    ``buffers`` to serialize() to collect large pickle.PickleBuffer payloads
+    without copying them into the stream, and the same list to deserialize().
     """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
+    handler_type = "pickle"
 
-        Returns:
-            The handler type identifier ("pickle")
-        """
-        return "pickle"
+    #: Pickle protocol used by serialize(); override in a subclass to pin an older one
+    protocol: int = pickle.HIGHEST_PROTOCOL
 
-    def serialize(self, obj: Any) -> bytes:
+    def serialize(self, obj: Any, buffers: Optional[List[Any]] = None) -> bytes:
         """Serialize using pickle.
 
         Args:
             obj: The Python object to serialize
+            buffers: Optional list that out-of-band pickle.PickleBuffer objects are
+                     appended to instead of being copied into the pickle
 
         Returns:
             Pickled bytes representation
         """
-        return pickle.dumps(obj)
-
-    def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
+        if buffers is None:
+            return pickle.dumps(obj, protocol=self.protocol)
+        return pickle.dumps(obj, protocol=self.protocol, buffer_callback=buffers.append)
+
+    def deserialize(
+        self,
+        data: Union[str, bytes],
+        target_type: Optional[Type[T]] = None,
+        buffers: Optional[Iterable[Any]] = None,
+    ) -> T:
         """Deserialize using pickle.
 
         Args:
             data: The pickled data (bytes)
             target_type: Optional type hint (ignored, pickle handles types)
+            buffers: Out-of-band buffers collected by serialize(), in the same order
 
         Returns:
             Deserialized Python object
         """
         if isinstance(data, str):
             data = data.encode("utf-8")
-        return pickle.loads(data)
+        return pickle.loads(data, buffers=buffers)
 
 
 class JSONSerDe(SerDe):
-    """Standard JSON SerDe using Python's json module."""
+    """Standard JSON SerDe.
+
+    Uses orjson when it is installed and Python's json module otherwise. Both
+    paths route objects they cannot encode natively through _default_serializer(),
+    so subclasses can override it either way. Datetimes, dates and times are
+    written as ISO 8601 strings; orjson formats them itself unless a subclass
+    changes how they are converted.
+
+    Payloads containing NaN or infinite floats in their dicts, lists and tuples
+    are always encoded by the json module (as NaN/Infinity), since orjson would
+    write them as null, and read back with it. Otherwise orjson output differs from the json module's:
+
+        - separators are compact (no spaces after "," and ":")
+        - non-ASCII characters are written as UTF-8 rather than \\u escapes
+        - types orjson encodes natively, such as uuid.UUID and Enum members,
+          are serialized instead of going through _default_serializer()
+    """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
+    handler_type = "json"
 
-        Returns:
-            The handler type identifier ("json")
+    #: Converters used by _default_serializer(), keyed by type. Subclasses can
+    #: replace this table (e.g. to format datetimes differently) rather than
+    #: overriding _default_serializer().
+    _default_handlers: Dict[type, Callable[[Any], Any]] = {
+        datetime: datetime.isoformat,
+        date: date.isoformat,
+        time: time.isoformat,
+    }
+
+    #: Options passed to orjson.dumps(), set per class by __init_subclass__()
+    _orjson_options: int = _ORJSON_OPTIONS
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Pick the orjson options for a subclass.
+
+        orjson's native datetime output matches the isoformat() converters above,
+        so datetimes only go through _default_serializer() when a subclass
+        replaces the converter table or the serializer itself.
         """
-        return "json"
+        super().__init_subclass__(**kwargs)
+        customized = (
+            cls._default_handlers is not JSONSerDe._default_handlers
+            or cls._default_serializer is not JSONSerDe._default_serializer
+        )
+        cls._orjson_options = _ORJSON_OPTIONS | (_ORJSON_PASSTHROUGH_DATETIME if customized else 0)
 
     def serialize(self, obj: Any) -> str:
         """Serialize using standard JSON encoding.
@@ -134,7 +290,9 @@ class JSONSerDe(SerDe):
         Returns:
             JSON string representation
         """
-        return json.dumps(obj, default=self._default_serializer)
+        if ORJSON_AVAILABLE:
+            return self.serialize_bytes(obj).decode("utf-8")
+        return _json_dumps(obj, default=self._default_serializer)
 
     def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
         """Deserialize JSON string/bytes back to a Python object.
@@ -146,10 +304,42 @@ class JSONSerDe(SerDe):
         Returns:
             Deserialized Python object
         """
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
+        # Both decoders accept str and UTF-8 bytes
+        try:
+            return _json_loads(data)
+        except ValueError:
+            if not ORJSON_AVAILABLE:
+                raise
+        # orjson rejects NaN and Infinity, which the json module writes and reads
         return json.loads(data)
 
+    def serialize_bytes(self, obj: Any) -> bytes:
+        """Serialize to UTF-8 encoded JSON bytes.
+
+        Same output as serialize(), but without decoding orjson's bytes to a
+        string, for callers that write or re-encode bytes anyway.
+
+        Args:
+            obj: The Python object to serialize
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                encoded = _json_dumps(
+                    obj, default=self._default_serializer, option=self._orjson_options
+                )
+            except TypeError:
+                # orjson rejects some values json accepts (e.g. integers over 64 bits)
+                pass
+            else:
+                # orjson writes NaN and infinities as null, so only output with a null
+                # needs checking for them
+                if b"null" not in encoded or not _has_non_finite(obj):
+                    return encoded
+        return json.dumps(obj, default=self._default_serializer).encode("utf-8")
+
     def _default_serializer(self, obj: Any) -> Any:
         """Default serializer for non-serializable objects.
 
@@ -162,10 +352,13 @@ class JSONSerDe(SerDe):
         Raises:
             TypeError: If object cannot be serialized
         """
-        from datetime import datetime
-
-        if isinstance(obj, datetime):
-            return obj.isoformat()
+        handlers = self._default_handlers
+        handler = handlers.get(type(obj))
+        if handler is None:
+            # Subclasses of a handled type (e.g. datetime subclasses) use the base's converter
+            handler = next((handlers[b] for b in type(obj).__mro__[1:] if b in handlers), None)
+        if handler is not None:
+            return handler(obj)
         if hasattr(obj, "__dict__"):
             return obj.__dict__
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
@@ -175,16 +368,10 @@ class Base64SerDe(SerDe):
     """Base64 encoding SerDe.
 
     Encodes/decodes data using base64 encoding. Input must be bytes.
+    Uses pybase64's SIMD codecs when installed, the base64 module otherwise.
     """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
-
-        Returns:
-            The handler type identifier ("base64")
-        """
-        return "base64"
+    handler_type = "base64"
 
     def serialize(self, obj: Any) -> str:
         """Serialize using base64 encoding.
@@ -199,7 +386,7 @@ class Base64SerDe(SerDe):
             obj = obj.encode("utf-8")
         elif not isinstance(obj, bytes):
             obj = pickle.dumps(obj)  # Fallback to pickle for complex objects
-        return base64.b64encode(obj).decode("utf-8")
+        return _b64encode(obj)
 
     def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
         """Deserialize base64-encoded data.
@@ -213,26 +400,68 @@ class Base64SerDe(SerDe):
         """
         if isinstance(data, str):
             data = data.encode("utf-8")
-        return base64.b64decode(data)  # type: ignore[return-value]
+        return _b64decode(data)  # type: ignore[return-value]
+
+
+class _NamespacedTag(Exception):
+    """Raised by XMLSerDe's fragment emitter for a "{uri}tag" key it cannot write."""
 
 
 class XMLSerDe(SerDe):
     """XML encoding SerDe.
 
     Encodes/decodes data using XML. For simple dict/list structures.
+    Documents are written by emitting string fragments directly (the same
+    output ElementTree.tostring() gives) and parsed with lxml when installed,
+    xml.etree.ElementTree otherwise. Dicts with namespaced keys ("{uri}tag")
+    are written with ElementTree, which declares the namespace prefixes.
     """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
+    handler_type = "xml"
+
+    def serialize(self, obj: Any) -> str:
+        """Serialize using XML encoding.
+
+        Args:
+            obj: The Python object to serialize (dict or list)
 
         Returns:
-            The handler type identifier ("xml")
+            XML string representation
         """
-        return "xml"
+        out: List[str] = []
+        try:
+            if isinstance(obj, dict):
+                self._emit_dict("root", obj, out)
+            elif isinstance(obj, list):
+                self._emit_items("root", obj, out)
+            else:
+                self._emit_text("root", str(obj), out)
+        except _NamespacedTag:
+            return self._serialize_etree(obj)
+        return "".join(out)
 
-    def serialize(self, obj: Any) -> str:
-        """Serialize using XML encoding.
+    def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
+        """Deserialize XML string/bytes back to a Python object.
+
+        Args:
+            data: The XML string or bytes
+            target_type: Optional type hint (returns dict by default)
+
+        Returns:
+            Deserialized Python object (dict or list)
+        """
+        if LXML_AVAILABLE:
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            root = lxml_etree.fromstring(data, _LXML_PARSER)
+        else:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            root = ET.fromstring(data)
+        return self._xml_to_dict(root)  # type: ignore[return-value]
+
+    def _serialize_etree(self, obj: Any) -> str:
+        """Serialize by building an ElementTree, for documents that need namespaces.
 
         Args:
             obj: The Python object to serialize (dict or list)
@@ -240,11 +469,10 @@ class XMLSerDe(SerDe):
         Returns:
             XML string representation
         """
+        root = ET.Element("root")
         if isinstance(obj, dict):
-            root = ET.Element("root")
             self._dict_to_xml(obj, root)
         elif isinstance(obj, list):
-            root = ET.Element("root")
             for item in obj:
                 elem = ET.SubElement(root, "item")
                 if isinstance(item, dict):
@@ -252,27 +480,10 @@ class XMLSerDe(SerDe):
                 else:
                     elem.text = str(item)
         else:
-            root = ET.Element("root")
             root.text = str(obj)
 
         return ET.tostring(root, encoding="unicode")
 
-    def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
-        """Deserialize XML string/bytes back to a Python object.
-
-        Args:
-            data: The XML string or bytes
-            target_type: Optional type hint (returns dict by default)
-
-        Returns:
-            Deserialized Python object (dict or list)
-        """
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
-
-        root = ET.fromstring(data)
-        return self._xml_to_dict(root)  # type: ignore[return-value]
-
     def _dict_to_xml(self, d: dict, parent: ET.Element) -> None:
         """Convert dict to XML elements.
 
@@ -297,6 +508,74 @@ class XMLSerDe(SerDe):
             else:
                 elem.text = str(value)
 
+    def _emit_dict(self, tag: str, d: dict, out: List[str]) -> None:
+        """Append the XML fragments for a dict element to out.
+
+        Args:
+            tag: Tag of the element holding the dict
+            d: Dictionary whose keys become child elements
+            out: Fragment list the serialized XML is appended to
+
+        Returns:
+            None (appends to out in place)
+
+        Raises:
+            _NamespacedTag: If a key is a namespaced "{uri}tag" name
+        """
+        if not d:
+            out.append(f"<{tag} />")
+            return
+        out.append(f"<{tag}>")
+        for key, value in d.items():
+            key = str(key)
+            if key[:1] == "{":
+                raise _NamespacedTag(key)
+            if isinstance(value, dict):
+                self._emit_dict(key, value, out)
+            elif isinstance(value, list):
+                self._emit_items(key, value, out)
+            else:
+                self._emit_text(key, str(value), out)
+        out.append(f"</{tag}>")
+
+    def _emit_items(self, tag: str, items: list, out: List[str]) -> None:
+        """Append the XML fragments for a list element (one <item> per entry) to out.
+
+        Args:
+            tag: Tag of the element holding the list
+            items: List entries; dicts nest, anything else becomes item text
+            out: Fragment list the serialized XML is appended to
+
+        Returns:
+            None (appends to out in place)
+        """
+        if not items:
+            out.append(f"<{tag} />")
+            return
+        out.append(f"<{tag}>")
+        for item in items:
+            if isinstance(item, dict):
+                self._emit_dict("item", item, out)
+            else:
+                self._emit_text("item", str(item), out)
+        out.append(f"</{tag}>")
+
+    def _emit_text(self, tag: str, text: str, out: List[str]) -> None:
+        """Append a text-only element to out, escaped as ElementTree does.
+
+        Args:
+            tag: Element tag
+            text: Element text
+            out: Fragment list the serialized XML is appended to
+
+        Returns:
+            None (appends to out in place)
+        """
+        if text:
+            out.append(f"<{tag}>{xml_escape(text)}</{tag}>")
+        else:
+            out.append(f"<{tag} />")
+
     def _xml_to_dict(self, elem: ET.Element) -> Union[Dict[str, Any], List[Any], str]:
         """Convert XML element to dict/list.
 
@@ -327,14 +606,7 @@ class YAMLSerDe(SerDe):
     Uses PyYAML if available, otherwise raises ImportError.
     """
 
-    @property
-    def handler_type(self) -> str:
-        """Return the handler type identifier.
-
-        Returns:
-            The handler type identifier ("yaml")
-        """
-        return "yaml"
+    handler_type = "yaml"
 
     def serialize(self, obj: Any) -> str:
         """Serialize using YAML encoding.
@@ -348,9 +620,7 @@ class YAMLSerDe(SerDe):
         Raises:
             ImportError: If PyYAML is not available
         """
-        if not YAML_AVAILABLE:
-            raise ImportError("PyYAML is not installed. Install it with: pip install pyyaml")
-        return yaml.dump(obj, default_flow_style=False)
+        return _yaml().dump(obj, default_flow_style=False)
 
     def deserialize(self, data: Union[str, bytes], target_type: Optional[Type[T]] = None) -> T:
         """Deserialize YAML string/bytes back to a Python object.
@@ -365,8 +635,7 @@ class YAMLSerDe(SerDe):
         Raises:
             ImportError: If PyYAML is not available
         """
-        if not YAML_AVAILABLE:
-            raise ImportError("PyYAML is not installed. Install it with: pip install pyyaml")
+        yaml = _yaml()
         if isinstance(data, bytes):
             data = data.decode("utf-8")
         return yaml.safe_load(data)
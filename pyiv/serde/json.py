@@ -5,8 +5,9 @@ the encodings module for backward compatibility and convenience.
 
 Architecture:
     JSON SerDe is part of the chain of responsibility pattern for the
-    ENCODING chain type. It uses Python's standard json module for
-    serialization/deserialization.
+    ENCODING chain type. It uses orjson for serialization/deserialization
+    when installed (``pip install pyiv[orjson]``) and Python's standard json
+    module otherwise.
 
 Usage:
     Import JSONSerDe directly:
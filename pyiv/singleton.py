@@ -50,7 +50,8 @@ class GlobalSingletonRegistry:
     """Thread-safe registry for global singletons.
 
     This registry stores singleton instances that are shared across
-    all injector instances. Access is thread-safe.
+    all injector instances. Access is thread-safe: reads are single dict
+    operations (atomic under the GIL) and take no lock, writes are serialized.
 
     Supports both Type keys (for standard DI) and string keys (for SerDe
     and other named instances).
@@ -70,8 +71,7 @@ class GlobalSingletonRegistry:
         Returns:
             The singleton instance or None if not registered
         """
-        with cls._lock:
-            return cls._instances.get(key)
+        return cls._instances.get(key)
 
     @classmethod
     def set(cls, key: Union[Type, str], instance: Any) -> None:
@@ -96,8 +96,25 @@ class GlobalSingletonRegistry:
         Returns:
             True if a singleton exists, False otherwise
         """
+        return key in cls._instances
+
+    @classmethod
+    def setdefault(cls, key: Union[Type, str], instance: Any) -> Any:
+        """Store a global singleton instance unless one is already registered.
+
+        Threads that race to create the same singleton all get back the
+        instance stored first.
+
+        Args:
+            cls: The class (implicit in classmethod)
+            key: The abstract type or string key
+            instance: The instance to store if the key is not registered
+
+        Returns:
+            The registered instance for the key
+        """
         with cls._lock:
-            return key in cls._instances
+            return cls._instances.setdefault(key, instance)
 
     @classmethod
     def clear(cls) -> None:
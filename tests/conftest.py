@@ -1,16 +1,41 @@
-"""Pytest configuration and fixtures for console tests."""
+"""Pytest configuration and shared fixtures."""
 
+import contextlib
+import importlib.abc
+import importlib.util
 import os
 import pty
+import shutil
 import sys
+from pathlib import Path
+from types import CodeType
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pytest
 
 
+def pytest_addoption(parser):
+    """Add command line options."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest markers."""
     config.addinivalue_line("markers", "tty: mark test as requiring TTY (will use PTY for testing)")
     config.addinivalue_line("markers", "integration: mark test as integration test")
+    config.addinivalue_line("markers", "slow: mark test as slow (skipped unless --run-slow)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 @pytest.fixture(scope="session")
@@ -33,3 +58,290 @@ def pty_context():
 
     os.close(master_fd)
     slave_stream.close()
+
+
+# Code objects for in-memory module sources, keyed by (module name, source)
+_compiled_sources: Dict[Tuple[str, str], CodeType] = {}
+
+
+class InMemoryLoader(importlib.abc.Loader):
+    """Loader that executes module source held in memory."""
+
+    def __init__(self, source: str, created: Set[str]):
+        """Initialize the loader.
+
+        Args:
+            source: Python source code of the module
+            created: Set that records the name of every module this loader executes
+        """
+        self._source = source
+        self._created = created
+
+    def create_module(self, spec):
+        """Use the default module creation semantics."""
+        return None
+
+    def exec_module(self, module):
+        """Execute the in-memory source in the module namespace."""
+        name = module.__name__
+        self._created.add(name)
+        # Tests reuse the same sources, so each is parsed and compiled once per session
+        code = _compiled_sources.get((name, self._source))
+        if code is None:
+            code = compile(self._source, f"<virtual:{name}>", "exec")
+            _compiled_sources[(name, self._source)] = code
+        exec(code, module.__dict__)  # nosec B102 - test-only loader for fixture sources
+
+
+class InMemoryFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder serving modules from a name -> source mapping.
+
+    A module is treated as a package when any other module in the mapping
+    is nested below it, so ``{"pkg": "", "pkg.mod": "..."}`` makes ``pkg``
+    a package and ``pkg.mod`` a plain module.
+    """
+
+    def __init__(self, modules: Dict[str, str]):
+        """Initialize the finder.
+
+        Args:
+            modules: Mapping of fully qualified module names to source code
+        """
+        self._modules = modules
+        self.created: Set[str] = set()
+
+    def find_spec(self, fullname, path, target=None):
+        """Return a spec for modules held by this finder, None otherwise."""
+        source = self._modules.get(fullname)
+        if source is None:
+            return None
+        prefix = fullname + "."
+        is_package = any(name.startswith(prefix) for name in self._modules)
+        return importlib.util.spec_from_loader(
+            fullname, InMemoryLoader(source, self.created), is_package=is_package
+        )
+
+
+@pytest.fixture
+def virtual_package():
+    """Serve test packages from memory instead of writing them to disk.
+
+    Returns a function taking a mapping of module names to source code. The
+    modules become importable without touching the filesystem or sys.path;
+    the finder and the modules are removed again when the test finishes.
+
+    Example:
+        def test_discovery(virtual_package):
+            virtual_package({"test_package": "", "test_package.handlers": SOURCE})
+            config.register_module(Handler, "test_package.handlers")
+    """
+    finders: List[InMemoryFinder] = []
+
+    def install(modules: Dict[str, str]) -> None:
+        # Evict stale modules left behind under the same names so ours are served
+        for name in modules:
+            sys.modules.pop(name, None)
+        finder = InMemoryFinder(dict(modules))
+        sys.meta_path.insert(0, finder)
+        finders.append(finder)
+
+    yield install
+
+    # Only drop the modules the finders actually executed, not a sys.modules scan
+    for finder in finders:
+        sys.meta_path.remove(finder)
+        for name in finder.created:
+            sys.modules.pop(name, None)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a template file into place, copying where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+class FileLayoutFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder for a package tree whose file locations are known up front.
+
+    Specs point straight at the files, so importing the tree never searches
+    sys.path or stats candidate paths.
+    """
+
+    def __init__(self, root: Path, files: Iterable[Path]):
+        """Initialize the finder.
+
+        Args:
+            root: Directory the package tree was written to
+            files: Paths of the tree's ``.py`` files, relative to root
+        """
+        self._root = root
+        self._locations: Dict[str, Path] = {}
+        for relative_path in files:
+            parts = relative_path.with_suffix("").parts
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            self._locations[".".join(parts)] = root / relative_path
+
+    def find_spec(self, fullname, path, target=None):
+        """Return a file spec for modules in the tree, None otherwise."""
+        location = self._locations.get(fullname)
+        if location is None:
+            return None
+        if location.name == "__init__.py":
+            return importlib.util.spec_from_file_location(
+                fullname, location, submodule_search_locations=[str(location.parent)]
+            )
+        return importlib.util.spec_from_file_location(fullname, location)
+
+
+class PackageTemplate:
+    """Package tree written once per session and cloned into each test's directory.
+
+    Files are hard-linked where the filesystem allows it, so a clone costs
+    directory entries rather than file writes.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize the template.
+
+        Args:
+            root: Directory holding the pre-built package tree
+        """
+        self.root = root
+
+    def clone(self, dest: Path, overrides: Optional[Dict[str, str]] = None) -> Path:
+        """Copy the template tree into a directory.
+
+        Args:
+            dest: Directory to clone into (usually the test's tmp_path)
+            overrides: Optional mapping of relative file paths to replacement source
+
+        Returns:
+            The destination directory
+        """
+        shutil.copytree(self.root, dest, dirs_exist_ok=True, copy_function=_link_or_copy)
+        for relative_path, source in (overrides or {}).items():
+            path = dest / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unlink first so writing never goes through a hard link into the template
+            if path.exists():
+                path.unlink()
+            path.write_text(source)
+        return dest
+
+
+@pytest.fixture(scope="session")
+def package_template(tmp_path_factory) -> Callable[[str, Dict[str, str]], PackageTemplate]:
+    """Build named package templates once per session (once per xdist worker).
+
+    Returns a function taking a template name and a mapping of relative file
+    paths to source. The files are only written the first time a name is seen.
+
+    Example:
+        def test_discovery(tmp_path, package_template):
+            package_template("handlers", LAYOUT).clone(tmp_path)
+    """
+    templates: Dict[str, PackageTemplate] = {}
+
+    def get(name: str, files: Dict[str, str]) -> PackageTemplate:
+        template = templates.get(name)
+        if template is None:
+            root = tmp_path_factory.mktemp(f"template-{name}")
+            for relative_path, source in files.items():
+                path = root / relative_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(source)
+            template = templates[name] = PackageTemplate(root)
+        return template
+
+    return get
+
+
+@pytest.fixture
+def make_pkg(tmp_path) -> Callable[..., ContextManager[Path]]:
+    """Write a package layout under tmp_path and make it importable.
+
+    Returns a context manager factory taking a mapping of relative file paths
+    (e.g. ``"test_pkg/sub/mod.py"``) to source and an optional PackageTemplate
+    to clone first. Inside the block a FileLayoutFinder serves the written
+    files by their exact locations, without tmp_path going on sys.path; on
+    exit the finder is removed and the tree's modules are dropped from
+    sys.modules.
+
+    Example:
+        def test_discovery(make_pkg):
+            with make_pkg({"test_pkg/__init__.py": "", "test_pkg/mod.py": SOURCE}):
+                config.register_module(Service, "test_pkg")
+    """
+
+    @contextlib.contextmanager
+    def make(layout: Dict[str, str], template: Optional[PackageTemplate] = None) -> Iterator[Path]:
+        if template is not None:
+            template.clone(tmp_path, overrides=layout)
+        else:
+            for relative_path, source in layout.items():
+                path = tmp_path / relative_path
+                os.makedirs(path.parent, exist_ok=True)
+                path.write_text(source)
+
+        entries = {Path(relative_path).parts[0] for relative_path in layout}
+        if template is not None:
+            entries.update(entry.name for entry in template.root.iterdir())
+        top_level = {Path(entry).stem for entry in entries}
+
+        # Evict stale modules under the same names so the fresh tree is served
+        if not top_level.isdisjoint(sys.modules):
+            for name in [m for m in sys.modules if m.split(".", 1)[0] in top_level]:
+                del sys.modules[name]
+
+        files: List[Path] = []
+        for entry in sorted(entries):
+            top = tmp_path / entry
+            if top.is_dir():
+                files.extend(path.relative_to(tmp_path) for path in top.rglob("*.py"))
+            else:
+                files.append(Path(entry))
+        finder = FileLayoutFinder(tmp_path, files)
+
+        # Only modules imported inside the block can belong to the tree
+        before = frozenset(sys.modules)
+        sys.meta_path.insert(0, finder)
+        try:
+            yield tmp_path
+        finally:
+            sys.meta_path.remove(finder)
+            for name in set(sys.modules) - before:
+                if name.split(".", 1)[0] in top_level:
+                    del sys.modules[name]
+
+    return make
+
+
+@pytest.fixture(params=["virtual", pytest.param("disk", marks=pytest.mark.slow)])
+def package_loader(request) -> Iterator[Callable[[Dict[str, str]], None]]:
+    """Install test modules from memory, or from files on disk under --run-slow.
+
+    Takes the same module name -> source mapping as ``virtual_package``. The
+    default run serves the modules from memory; the slow-marked ``disk``
+    variant writes them as a package tree with ``make_pkg``, running the same
+    assertions against the regular file-based import machinery.
+    """
+    if request.param == "virtual":
+        yield request.getfixturevalue("virtual_package")
+        return
+
+    make_pkg = request.getfixturevalue("make_pkg")
+    with contextlib.ExitStack() as stack:
+
+        def install(modules: Dict[str, str]) -> None:
+            layout = {}
+            for name, source in modules.items():
+                relative_path = name.replace(".", "/")
+                if any(other.startswith(name + ".") for other in modules):
+                    relative_path += "/__init__"
+                layout[relative_path + ".py"] = source
+            stack.enter_context(make_pkg(layout))
+
+        yield install
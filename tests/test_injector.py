@@ -94,6 +94,30 @@ def test_inject_singleton():
     assert db1 is db2  # Same instance
 
 
+def test_injector_subclass_overrides_singleton_handler():
+    """Test that inject() dispatches to a subclass's override of a lifecycle handler."""
+
+    class SingletonConfig(Config):
+        def configure(self):
+            self.register(Database, PostgreSQL, singleton=True)
+
+    class CountingInjector(Injector):
+        def __init__(self, config):
+            super().__init__(config)
+            self.singleton_calls = 0
+
+        def _inject_singleton(self, cls, kwargs):
+            self.singleton_calls += 1
+            return super()._inject_singleton(cls, kwargs)
+
+    injector = CountingInjector(SingletonConfig())
+    db1 = injector.inject(Database)
+    db2 = injector.inject(Database)
+
+    assert db1 is db2
+    assert injector.singleton_calls == 2
+
+
 def test_inject_instance():
     """Test injecting a registered instance."""
     logger_instance = FileLogger("test.log")
@@ -1,5 +1,6 @@
 """Tests for NetworkClient interface and dependency injection integration."""
 
+import re
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -8,6 +9,9 @@ import pytest
 from pyiv import ChainType, Config, get_injector
 from pyiv.network import HTTPClient, HTTPSClient, NetworkClient
 
+_HTTP_ONLY_RE = re.compile(r"HTTPClient only supports http:// and https:// URLs")
+_HTTPS_ONLY_RE = re.compile(r"HTTPSClient only supports https:// URLs")
+
 
 class TestNetworkClientInterface:
     """Tests for the NetworkClient base interface."""
@@ -27,62 +31,52 @@ class TestNetworkClientInterface:
         assert client.handler_type == "https"
         assert client.chain_type == ChainType.NETWORK_CLIENT
 
-    def test_http_client_request_invalid_url(self):
-        """Test HTTPClient raises ValueError for non-HTTP URLs."""
-        client = HTTPClient()
-        with pytest.raises(ValueError, match="HTTPClient only supports http:// and https:// URLs"):
-            client.request("GET", "ftp://example.com")
-
-    def test_https_client_request_invalid_url(self):
-        """Test HTTPSClient raises ValueError for non-HTTPS URLs."""
-        client = HTTPSClient()
-        with pytest.raises(ValueError, match="HTTPSClient only supports https:// URLs"):
-            client.request("GET", "http://example.com")
-
+    @pytest.mark.parametrize(
+        "client_class,url,message_re",
+        [
+            (HTTPClient, "ftp://example.com", _HTTP_ONLY_RE),
+            (HTTPSClient, "http://example.com", _HTTPS_ONLY_RE),
+        ],
+    )
+    def test_client_request_invalid_url(self, client_class, url, message_re):
+        """Test clients raise ValueError for URLs with an unsupported scheme."""
+        client = client_class()
+        with pytest.raises(ValueError) as exc_info:
+            client.request("GET", url)
+        assert message_re.search(str(exc_info.value))
+
+    @pytest.mark.parametrize(
+        "client_class,url,body,content_type",
+        [
+            (HTTPClient, "http://example.com", b"<html>Hello</html>", "text/html"),
+            (HTTPSClient, "https://example.com", b'{"key": "value"}', "application/json"),
+        ],
+    )
     @patch("pyiv.network.clients.urlopen")
-    def test_http_client_request_success(self, mock_urlopen):
-        """Test HTTPClient makes successful requests."""
+    def test_client_request_success(self, mock_urlopen, client_class, url, body, content_type):
+        """Test HTTPClient and HTTPSClient make successful requests."""
         # Mock response
         mock_response = MagicMock()
         mock_response.getcode.return_value = 200
-        mock_response.headers = {"Content-Type": "text/html", "Content-Length": "123"}
-        mock_response.read.return_value = b"<html>Hello</html>"
-        mock_response.geturl.return_value = "http://example.com"
+        mock_response.headers = {"Content-Type": content_type}
+        mock_response.read.return_value = body
+        mock_response.geturl.return_value = url
         mock_urlopen.return_value.__enter__.return_value = mock_response
 
-        client = HTTPClient()
-        response = client.request("GET", "http://example.com")
+        client = client_class()
+        response = client.request("GET", url)
 
         assert response["status"] == 200
-        assert response["headers"]["Content-Type"] == "text/html"
-        assert response["body"] == b"<html>Hello</html>"
-        assert response["url"] == "http://example.com"
+        assert response["headers"]["Content-Type"] == content_type
+        assert response["body"] == body
+        assert response["url"] == url
 
         # Verify request was made correctly
         mock_urlopen.assert_called_once()
         call_args = mock_urlopen.call_args
-        assert call_args[0][0].full_url == "http://example.com"
+        assert call_args[0][0].full_url == url
         assert call_args[0][0].method == "GET"
 
-    @patch("pyiv.network.clients.urlopen")
-    def test_https_client_request_success(self, mock_urlopen):
-        """Test HTTPSClient makes successful requests."""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.getcode.return_value = 200
-        mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.read.return_value = b'{"key": "value"}'
-        mock_response.geturl.return_value = "https://example.com"
-        mock_urlopen.return_value.__enter__.return_value = mock_response
-
-        client = HTTPSClient()
-        response = client.request("GET", "https://example.com")
-
-        assert response["status"] == 200
-        assert response["headers"]["Content-Type"] == "application/json"
-        assert response["body"] == b'{"key": "value"}'
-        assert response["url"] == "https://example.com"
-
     @patch("pyiv.network.clients.urlopen")
     def test_http_client_request_with_headers(self, mock_urlopen):
         """Test HTTPClient includes custom headers in requests."""
@@ -100,17 +94,10 @@ class TestNetworkClientInterface:
         # Verify headers were added to request
         call_args = mock_urlopen.call_args
         request = call_args[0][0]
-        # Check headers using header_items() which returns all headers
-        header_dict = dict(request.header_items())
-        # urllib normalizes header names, so check case-insensitively
-        assert "authorization" in [k.lower() for k in header_dict.keys()]
-        assert "user-agent" in [k.lower() for k in header_dict.keys()]
-        # Verify values (check case-insensitively)
-        for key, value in header_dict.items():
-            if key.lower() == "authorization":
-                assert value == "Bearer token123"
-            elif key.lower() == "user-agent":
-                assert value == "pyiv/1.0"
+        # urllib normalizes header names, so index them case-insensitively once
+        headers_lower = {key.lower(): value for key, value in request.header_items()}
+        assert headers_lower["authorization"] == "Bearer token123"
+        assert headers_lower["user-agent"] == "pyiv/1.0"
 
     @patch("pyiv.network.clients.urlopen")
     def test_http_client_request_with_data(self, mock_urlopen):
@@ -1,13 +1,13 @@
 """Tests for reflection-based discovery in pyiv."""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
 
 import pytest
 
 from pyiv import ReflectionConfig, SingletonType, get_injector
-from pyiv.datetime_service import DateTimeService, MockDateTimeService, PythonDateTimeService
-from pyiv.filesystem import Filesystem, MemoryFilesystem, RealFilesystem
+from pyiv.datetime_service import DateTimeService
+from pyiv.filesystem import Filesystem
 
 
 # Test interfaces
@@ -30,6 +30,40 @@ class Handler(ABC):
 # Test implementations in a test package structure
 # We'll create these dynamically in tests
 
+# Module sources shared across tests. Kept identical so the virtual loader
+# compiles each one once per session rather than once per test.
+_CREATE_HANDLER_SRC = """
+from tests.test_reflection import Handler
+
+class CreateHandler(Handler):
+    def handle(self, data: str) -> str:
+        return "create"
+"""
+
+_MAIN_HANDLER_SRC = """
+from tests.test_reflection import Handler
+
+class MainHandler(Handler):
+    def handle(self, data: str) -> str:
+        return "main"
+"""
+
+_SUB_HANDLER_SRC = """
+from tests.test_reflection import Handler
+
+class SubHandler(Handler):
+    def handle(self, data: str) -> str:
+        return "sub"
+"""
+
+# On-disk layout for recursive discovery: a main module plus a nested subpackage
+_RECURSIVE_HANDLERS_LAYOUT = {
+    "test_package/__init__.py": "",
+    "test_package/handlers.py": _MAIN_HANDLER_SRC,
+    "test_package/submodule/__init__.py": "",
+    "test_package/submodule/handlers.py": _SUB_HANDLER_SRC,
+}
+
 
 class TestReflectionConfig:
     """Tests for ReflectionConfig basic functionality."""
@@ -55,21 +89,46 @@ class TestReflectionConfig:
         result = config.discover_implementations(Service)
         assert result == {}
 
+    def test_register_module_in_configure(self, package_loader):
+        """Test that modules registered in configure() are discovered."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
+from tests.test_reflection import Handler, Service
+
+class CreateHandler(Handler):
+    def handle(self, data: str) -> str:
+        return "create"
+
+class LocalService(Service):
+    def do_something(self) -> str:
+        return "local"
+""",
+            }
+        )
+
+        class HandlerConfig(ReflectionConfig):
+            def configure(self):
+                self.register_module(Handler, "test_package.handlers")
+                self.register_module(Service, "test_package.handlers")
+
+        config = HandlerConfig()
+
+        # Both interfaces scan the same module; each only sees its own classes
+        assert set(config.discover_implementations(Handler)) == {"CreateHandler"}
+        assert set(config.discover_implementations(Service)) == {"LocalService"}
+
 
 class TestReflectionDiscovery:
     """Tests for reflection-based discovery."""
 
-    def test_discover_implementations_in_package(self, tmp_path):
+    def test_discover_implementations_in_package(self, package_loader):
         """Test that implementations are discovered within the specified package."""
-        # Create a test package structure
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        # Create a handler module
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
@@ -79,42 +138,24 @@ class CreateHandler(Handler):
 class UpdateHandler(Handler):
     def handle(self, data: str) -> str:
         return f"updated: {data}"
-"""
+""",
+            }
         )
 
-        # Import the package
-        import importlib
-        import sys
+        # Register and discover
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
 
-        sys.path.insert(0, str(tmp_path))
+        implementations = config.discover_implementations(Handler)
 
-        try:
-            # Register and discover
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        assert set(implementations) == {"CreateHandler", "UpdateHandler"}
 
-            implementations = config.discover_implementations(Handler)
-
-            assert "CreateHandler" in implementations
-            assert "UpdateHandler" in implementations
-            assert len(implementations) == 2
-        finally:
-            sys.path.remove(str(tmp_path))
-            # Clean up module cache
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
-
-    def test_discover_implementations_with_pattern(self, tmp_path):
+    def test_discover_implementations_with_pattern(self, package_loader):
         """Test that pattern matching filters discovered implementations."""
-        # Create a test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
@@ -127,66 +168,24 @@ class UpdateHandler(Handler):
 
 class NotAHandler:
     pass
-"""
+""",
+            }
         )
 
-        import sys
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
 
-        sys.path.insert(0, str(tmp_path))
+        implementations = config.discover_implementations(Handler)
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        # Should only find classes matching *Handler pattern (so no NotAHandler)
+        assert set(implementations) == {"CreateHandler", "UpdateHandler"}
 
-            implementations = config.discover_implementations(Handler)
-
-            # Should only find classes matching *Handler pattern
-            assert "CreateHandler" in implementations
-            assert "UpdateHandler" in implementations
-            assert "NotAHandler" not in implementations
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
-
-    def test_discover_implementations_recursive(self, tmp_path):
+    def test_discover_implementations_recursive(self, make_pkg, package_template):
         """Test that recursive discovery finds implementations in submodules."""
-        # Create package structure
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        # Main module
-        (test_package_dir / "handlers.py").write_text(
-            """
-from tests.test_reflection import Handler
-
-class MainHandler(Handler):
-    def handle(self, data: str) -> str:
-        return "main"
-"""
-        )
-
-        # Submodule
-        submodule_dir = test_package_dir / "submodule"
-        submodule_dir.mkdir()
-        (submodule_dir / "__init__.py").write_text("")
-        (submodule_dir / "handlers.py").write_text(
-            """
-from tests.test_reflection import Handler
+        # Recursive discovery walks the package directory, so this one stays on disk
+        template = package_template("recursive_handlers", _RECURSIVE_HANDLERS_LAYOUT)
 
-class SubHandler(Handler):
-    def handle(self, data: str) -> str:
-        return "sub"
-"""
-        )
-
-        import sys
-
-        sys.path.insert(0, str(tmp_path))
-
-        try:
+        with make_pkg({}, template):
             config = ReflectionConfig()
             config.register_module(Handler, "test_package", pattern="*Handler", recursive=True)
 
@@ -200,76 +199,92 @@ class SubHandler(Handler):
             # Submodule class should be discovered - check for any name containing SubHandler
             submodule_found = any("SubHandler" in name for name in implementations.keys())
             assert submodule_found, f"SubHandler not found in {list(implementations.keys())}"
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
 
-    def test_discover_implementations_no_recursive(self, tmp_path):
-        """Test that non-recursive discovery only finds implementations in main module."""
-        # Create package structure
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        # Main module
-        (test_package_dir / "handlers.py").write_text(
-            """
-from tests.test_reflection import Handler
+    def test_discover_skips_modules_without_candidate_classes(self, make_pkg, package_template):
+        """Test that modules whose source cannot define a match are never imported."""
+        template = package_template("recursive_handlers", _RECURSIVE_HANDLERS_LAYOUT)
+        layout = {
+            "test_package/constants.py": 'raise RuntimeError("must not be imported")\n',
+            "test_package/models.py": "class Model:\n    pass\n",
+        }
 
-class MainHandler(Handler):
-    def handle(self, data: str) -> str:
-        return "main"
-"""
-        )
+        with make_pkg(layout, template):
+            config = ReflectionConfig()
+            config.register_module(Handler, "test_package", pattern="*Handler", recursive=True)
 
-        # Submodule
-        submodule_dir = test_package_dir / "submodule"
-        submodule_dir.mkdir()
-        (submodule_dir / "__init__.py").write_text("")
-        (submodule_dir / "handlers.py").write_text(
-            """
-from tests.test_reflection import Handler
+            implementations = config.discover_implementations(Handler)
 
-class SubHandler(Handler):
-    def handle(self, data: str) -> str:
-        return "sub"
-"""
-        )
+            assert any("MainHandler" in name for name in implementations)
+            # Neither source mentions "Handler", so neither can define a match
+            assert "test_package.constants" not in sys.modules
+            assert "test_package.models" not in sys.modules
+
+    @pytest.mark.parametrize("pattern", [None, "*Handler"])
+    def test_discover_dynamically_created_classes(self, make_pkg, pattern):
+        """Test that classes created without a class statement are still discovered."""
+        layout = {
+            "test_pkg/__init__.py": "",
+            "test_pkg/mod.py": (
+                "from tests.test_reflection import Handler\n"
+                "\n"
+                'namespace = {"__module__": __name__, "handle": lambda self, data: data}\n'
+                'CreateHandler = type("CreateHandler", (Handler,), namespace)\n'
+            ),
+        }
+
+        with make_pkg(layout):
+            config = ReflectionConfig()
+            config.register_module(Handler, "test_pkg", pattern=pattern, recursive=True)
+
+            implementations = config.discover_implementations(Handler)
+
+            assert set(implementations) == {"mod.CreateHandler"}
 
-        import sys
+    def test_discover_without_finder_find_spec(self, make_pkg, monkeypatch):
+        """Test that finders without find_spec() (zipimport before 3.10) are not filtered."""
+        import pkgutil
 
-        sys.path.insert(0, str(tmp_path))
+        layout = {"test_pkg/__init__.py": "", "test_pkg/mod.py": _CREATE_HANDLER_SRC}
+        iter_modules = pkgutil.iter_modules
 
-        try:
+        def iter_modules_without_find_spec(path=None, prefix=""):
+            for module_info in iter_modules(path, prefix):
+                yield module_info._replace(module_finder=object())
+
+        with make_pkg(layout):
+            monkeypatch.setattr(pkgutil, "iter_modules", iter_modules_without_find_spec)
             config = ReflectionConfig()
-            config.register_module(
-                Handler, "test_package.handlers", pattern="*Handler", recursive=False
-            )
+            config.register_module(Handler, "test_pkg", pattern="*Handler", recursive=True)
 
-            implementations = config.discover_implementations(Handler)
+            assert set(config.discover_implementations(Handler)) == {"mod.CreateHandler"}
+
+    def test_discover_implementations_no_recursive(self, package_loader):
+        """Test that non-recursive discovery only finds implementations in main module."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _MAIN_HANDLER_SRC,
+                "test_package.submodule": "",
+                "test_package.submodule.handlers": _SUB_HANDLER_SRC,
+            }
+        )
 
-            assert "MainHandler" in implementations
-            # Submodule should not be discovered
-            assert "SubHandler" not in implementations
-            assert "submodule.handlers.SubHandler" not in implementations
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
-
-    def test_discover_implementations_excludes_imported_classes(self, tmp_path):
+        config = ReflectionConfig()
+        config.register_module(
+            Handler, "test_package.handlers", pattern="*Handler", recursive=False
+        )
+
+        implementations = config.discover_implementations(Handler)
+
+        # Submodule should not be discovered
+        assert set(implementations) == {"MainHandler"}
+
+    def test_discover_implementations_excludes_imported_classes(self, package_loader):
         """Test that imported classes from other packages are not discovered."""
-        # Create test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 from pyiv.filesystem import RealFilesystem  # Import from another package
 
@@ -280,331 +295,325 @@ class LocalHandler(Handler):
 
 # This should NOT be discovered (imported from elsewhere)
 ImportedHandler = RealFilesystem
-"""
+""",
+            }
         )
 
-        import sys
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
 
-        sys.path.insert(0, str(tmp_path))
+        implementations = config.discover_implementations(Handler)
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        # Should only find LocalHandler, not RealFilesystem
+        assert set(implementations) == {"LocalHandler"}
 
-            implementations = config.discover_implementations(Handler)
+    def test_discover_implementations_excludes_interface_itself(self, package_loader):
+        """Test that the interface class itself is not discovered."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _CREATE_HANDLER_SRC,
+            }
+        )
 
-            # Should only find LocalHandler, not RealFilesystem
-            assert "LocalHandler" in implementations
-            assert len(implementations) == 1
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers")
 
-    def test_discover_implementations_excludes_interface_itself(self, tmp_path):
-        """Test that the interface class itself is not discovered."""
-        # Create test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        implementations = config.discover_implementations(Handler)
+
+        # Handler itself should not be in the results
+        assert Handler not in implementations.values()
+        assert "Handler" not in implementations
+
+    def test_discover_implementations_includes_virtual_subclasses(self, package_loader):
+        """Test that classes registered on an ABC are discovered like real subclasses."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
     def handle(self, data: str) -> str:
         return "create"
-"""
+
+class RegisteredHandler:
+    def handle(self, data: str) -> str:
+        return "registered"
+
+Handler.register(RegisteredHandler)
+
+class PlainHandler:
+    pass
+""",
+            }
         )
 
-        import sys
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers")
+
+        implementations = config.discover_implementations(Handler)
 
-        sys.path.insert(0, str(tmp_path))
+        assert set(implementations) == {"CreateHandler", "RegisteredHandler"}
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers")
+    def test_discover_implementations_cached(self, package_loader):
+        """Test that discovery results are cached until the module is re-registered."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _CREATE_HANDLER_SRC,
+            }
+        )
 
-            implementations = config.discover_implementations(Handler)
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+
+        first = config.discover_implementations(Handler)
+        first["Injected"] = object  # type: ignore[assignment]
+        second = config.discover_implementations(Handler)
+
+        # Callers get a copy, so mutating a result does not leak into the cache
+        assert "Injected" not in second
+        assert second["CreateHandler"] is first["CreateHandler"]
+
+        # Re-registering with a narrower pattern discards the cached result
+        config.register_module(Handler, "test_package.handlers", pattern="Update*")
+        assert config.discover_implementations(Handler) == {}
+
+    def test_get_implementation(self, package_loader):
+        """Test looking up a single discovered implementation by name."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _CREATE_HANDLER_SRC,
+            }
+        )
 
-            # Handler itself should not be in the results
-            assert Handler not in implementations.values()
-            assert "Handler" not in implementations
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+
+        handler_class = config.get_implementation(Handler, "CreateHandler")
+
+        assert handler_class is config.discover_implementations(Handler)["CreateHandler"]
+        assert config.get_implementation(Handler, "UnknownHandler") is None
+        assert config.get_implementation(Service, "CreateHandler") is None
 
 
 class TestReflectionWithExistingInterfaces:
     """Tests for discovering implementations of existing pyiv interfaces."""
 
-    def test_discover_filesystem_implementations(self, tmp_path):
+    def test_discover_filesystem_implementations(self, package_loader):
         """Test discovering Filesystem implementations from a package."""
-        # Create test package with Filesystem implementations
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        fs_module = test_package_dir / "filesystems.py"
-        fs_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.filesystems": """
 from pyiv.filesystem import Filesystem
 
 class CustomFilesystem(Filesystem):
     def open(self, file, mode="r", encoding=None):
         return open(file, mode, encoding=encoding)
-    
+
     def exists(self, path):
         return True
-    
+
     def read(self, path, encoding=None):
         return "test"
-    
+
     def write(self, path, content, encoding=None):
         pass
-    
+
     def delete(self, path):
         pass
-    
+
     def mkdir(self, path, parents=False):
         pass
-    
+
     def listdir(self, path):
         return []
-    
+
     def copy(self, src, dst):
         pass
-    
+
     def move(self, src, dst):
         pass
-"""
+""",
+            }
         )
 
-        import sys
-
-        sys.path.insert(0, str(tmp_path))
-
-        try:
-            config = ReflectionConfig()
-            config.register_module(Filesystem, "test_package.filesystems", pattern="*Filesystem")
+        config = ReflectionConfig()
+        config.register_module(Filesystem, "test_package.filesystems", pattern="*Filesystem")
 
-            implementations = config.discover_implementations(Filesystem)
+        implementations = config.discover_implementations(Filesystem)
 
-            assert "CustomFilesystem" in implementations
-            assert len(implementations) == 1
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        assert set(implementations) == {"CustomFilesystem"}
 
-    def test_discover_datetime_service_implementations(self, tmp_path):
+    def test_discover_datetime_service_implementations(self, package_loader):
         """Test discovering DateTimeService implementations from a package."""
-        # Create test package with DateTimeService implementations
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        dt_module = test_package_dir / "datetime_services.py"
-        dt_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.datetime_services": """
 from datetime import datetime, timezone
 from pyiv.datetime_service import DateTimeService
 
 class CustomDateTimeService(DateTimeService):
     def now_utc(self):
         return datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    
+
     def now_utc_iso(self):
         return "2024-01-01T12:00:00+00:00"
-"""
+""",
+            }
+        )
+
+        config = ReflectionConfig()
+        config.register_module(
+            DateTimeService,
+            "test_package.datetime_services",
+            pattern="*DateTimeService",
         )
 
-        import sys
+        implementations = config.discover_implementations(DateTimeService)
 
-        sys.path.insert(0, str(tmp_path))
+        assert set(implementations) == {"CustomDateTimeService"}
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(
-                DateTimeService,
-                "test_package.datetime_services",
-                pattern="*DateTimeService",
-            )
-
-            implementations = config.discover_implementations(DateTimeService)
-
-            assert "CustomDateTimeService" in implementations
-            assert len(implementations) == 1
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
-
-    def test_discover_exports_existing_implementations(self, tmp_path):
+    def test_discover_exports_existing_implementations(self, package_loader):
         """Test that a package can export existing pyiv implementations."""
-        # Create test package that re-exports existing implementations
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        exports_module = test_package_dir / "exports.py"
-        exports_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.exports": """
 # Re-export existing pyiv implementations
 from pyiv.filesystem import RealFilesystem, MemoryFilesystem
 from pyiv.datetime_service import PythonDateTimeService, MockDateTimeService
 
 # These are imported, not defined here, so they should NOT be discovered
 # Only locally defined classes should be discovered
-"""
-        )
-
-        # Create a local implementation
-        handlers_module = test_package_dir / "handlers.py"
-        handlers_module.write_text(
-            """
+""",
+                # Create a local implementation
+                "test_package.handlers": """
 from pyiv.filesystem import Filesystem
 
 class LocalFilesystem(Filesystem):
     def open(self, file, mode="r", encoding=None):
         return open(file, mode, encoding=encoding)
-    
+
     def exists(self, path):
         return True
-    
+
     def read(self, path, encoding=None):
         return ""
-    
+
     def write(self, path, content, encoding=None):
         pass
-    
+
     def delete(self, path):
         pass
-    
+
     def mkdir(self, path, parents=False):
         pass
-    
+
     def listdir(self, path):
         return []
-    
+
     def copy(self, src, dst):
         pass
-    
+
     def move(self, src, dst):
         pass
-"""
+""",
+            }
         )
 
-        import sys
-
-        sys.path.insert(0, str(tmp_path))
-
-        try:
-            config = ReflectionConfig()
-            config.register_module(Filesystem, "test_package.handlers", pattern="*Filesystem")
+        config = ReflectionConfig()
+        config.register_module(Filesystem, "test_package.handlers", pattern="*Filesystem")
 
-            implementations = config.discover_implementations(Filesystem)
+        implementations = config.discover_implementations(Filesystem)
 
-            # Should only find LocalFilesystem (defined in the module)
-            # Should NOT find RealFilesystem or MemoryFilesystem (imported)
-            assert "LocalFilesystem" in implementations
-            assert "RealFilesystem" not in implementations
-            assert "MemoryFilesystem" not in implementations
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        # Should only find LocalFilesystem (defined in the module)
+        # Should NOT find RealFilesystem or MemoryFilesystem (imported)
+        assert set(implementations) == {"LocalFilesystem"}
 
 
 class TestInjectByName:
     """Tests for inject_by_name functionality."""
 
-    def test_inject_by_name_basic(self, tmp_path):
+    def test_inject_by_name_basic(self, package_loader):
         """Test basic inject_by_name functionality."""
-        # Create test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
     def handle(self, data: str) -> str:
         return f"created: {data}"
-"""
+""",
+            }
         )
 
-        import sys
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
 
-        sys.path.insert(0, str(tmp_path))
+        injector = get_injector(config)
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        # Get handler class by name
+        handler_class = injector.inject_by_name(Handler, "CreateHandler")
 
-            injector = get_injector(config)
+        assert handler_class.__name__ == "CreateHandler"
+        assert issubclass(handler_class, Handler)
 
-            # Get handler class by name
-            handler_class = injector.inject_by_name(Handler, "CreateHandler")
+    def test_inject_by_name_not_found(self, package_loader):
+        """Test that inject_by_name raises ValueError for unknown name."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _CREATE_HANDLER_SRC,
+            }
+        )
 
-            assert handler_class.__name__ == "CreateHandler"
-            assert issubclass(handler_class, Handler)
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
 
-    def test_inject_by_name_not_found(self, tmp_path):
-        """Test that inject_by_name raises ValueError for unknown name."""
-        # Create test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        injector = get_injector(config)
+
+        with pytest.raises(ValueError, match="No implementation 'UnknownHandler' found"):
+            injector.inject_by_name(Handler, "UnknownHandler")
+
+    def test_inject_by_name_follows_reregistration(self, package_loader):
+        """Test that inject_by_name sees the new result after the module is re-registered."""
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": _CREATE_HANDLER_SRC,
+                "test_package.other_handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
     def handle(self, data: str) -> str:
-        return "create"
-"""
+        return "other"
+""",
+            }
         )
 
-        import sys
-
-        sys.path.insert(0, str(tmp_path))
+        config = ReflectionConfig()
+        config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        injector = get_injector(config)
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(Handler, "test_package.handlers", pattern="*Handler")
+        first = injector.inject_by_name(Handler, "CreateHandler")
+        assert injector.inject_by_name(Handler, "CreateHandler") is first
 
-            injector = get_injector(config)
+        config.register_module(Handler, "test_package.other_handlers", pattern="*Handler")
+        second = injector.inject_by_name(Handler, "CreateHandler")
 
-            with pytest.raises(ValueError, match="No implementation 'UnknownHandler' found"):
-                injector.inject_by_name(Handler, "UnknownHandler")
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        assert second is not first
+        assert second.__module__ == "test_package.other_handlers"
 
     def test_inject_by_name_requires_reflection_config(self):
         """Test that inject_by_name requires ReflectionConfig."""
-        from pyiv import Config, get_injector
+        from pyiv import Config
 
         class RegularConfig(Config):
             def configure(self):
@@ -615,62 +624,49 @@ class CreateHandler(Handler):
         with pytest.raises(ValueError, match="does not support reflection-based discovery"):
             injector.inject_by_name(Service, "SomeService")
 
-    def test_inject_by_name_with_singleton(self, tmp_path):
+    def test_inject_by_name_with_singleton(self, package_loader):
         """Test that inject_by_name works with singleton configuration."""
-        # Create test package
-        test_package_dir = tmp_path / "test_package"
-        test_package_dir.mkdir()
-        (test_package_dir / "__init__.py").write_text("")
-
-        handler_module = test_package_dir / "handlers.py"
-        handler_module.write_text(
-            """
+        package_loader(
+            {
+                "test_package": "",
+                "test_package.handlers": """
 from tests.test_reflection import Handler
 
 class CreateHandler(Handler):
     def __init__(self):
         self.calls = 0
-    
+
     def handle(self, data: str) -> str:
         self.calls += 1
         return f"created: {data}"
-"""
+""",
+            }
         )
 
-        import sys
+        config = ReflectionConfig()
+        config.register_module(
+            Handler,
+            "test_package.handlers",
+            pattern="*Handler",
+            singleton_type=SingletonType.SINGLETON,
+        )
 
-        sys.path.insert(0, str(tmp_path))
+        injector = get_injector(config)
 
-        try:
-            config = ReflectionConfig()
-            config.register_module(
-                Handler,
-                "test_package.handlers",
-                pattern="*Handler",
-                singleton_type=SingletonType.SINGLETON,
-            )
-
-            injector = get_injector(config)
-
-            # Get handler class
-            handler_class = injector.inject_by_name(Handler, "CreateHandler")
-
-            # Get instances via interface (should be singleton)
-            # When registered via reflection, injecting the interface should return the singleton
-            instance1 = injector.inject(Handler)
-            instance2 = injector.inject(Handler)
-
-            # Should be the same instance
-            assert instance1 is instance2
-            assert isinstance(instance1, handler_class)
-
-            # Verify it works
-            result = instance1.handle("test")
-            assert result == "created: test"
-            assert instance1.calls == 1
-            assert instance2.calls == 1  # Same instance
-        finally:
-            sys.path.remove(str(tmp_path))
-            modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_package")]
-            for m in modules_to_remove:
-                del sys.modules[m]
+        # Get handler class
+        handler_class = injector.inject_by_name(Handler, "CreateHandler")
+
+        # Get instances via interface (should be singleton)
+        # When registered via reflection, injecting the interface should return the singleton
+        instance1 = injector.inject(Handler)
+        instance2 = injector.inject(Handler)
+
+        # Should be the same instance
+        assert instance1 is instance2
+        assert isinstance(instance1, handler_class)
+
+        # Verify it works
+        result = instance1.handle("test")
+        assert result == "created: test"
+        assert instance1.calls == 1
+        assert instance2.calls == 1  # Same instance
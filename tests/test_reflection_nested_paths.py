@@ -1,9 +1,6 @@
 """Tests for nested submodule path handling in reflection discovery."""
 
-import sys
-import tempfile
 from abc import ABC, abstractmethod
-from pathlib import Path
 
 import pytest
 
@@ -18,59 +15,44 @@ class Service(ABC):
         pass
 
 
-def test_nested_submodules_preserve_full_path(tmp_path):
+def test_nested_submodules_preserve_full_path(make_pkg):
     """Test that nested submodules preserve full path to avoid name collisions."""
     # Create package structure:
     # test_pkg/
     #   mod.py (contains ClassA)
     #   sub/
     #     mod.py (contains ClassA)
-
-    test_package_dir = tmp_path / "test_pkg"
-    test_package_dir.mkdir()
-    (test_package_dir / "__init__.py").write_text("")
-
-    # Top-level mod.py
-    (test_package_dir / "mod.py").write_text(
-        """
+    layout = {
+        "test_pkg/__init__.py": "",
+        # Top-level mod.py
+        "test_pkg/mod.py": """
 from tests.test_reflection_nested_paths import Service
 
 class ClassA(Service):
     def do_something(self) -> str:
         return "top_level"
-"""
-    )
-
-    # Nested sub/mod.py
-    sub_dir = test_package_dir / "sub"
-    sub_dir.mkdir()
-    (sub_dir / "__init__.py").write_text("")
-    (sub_dir / "mod.py").write_text(
-        """
+""",
+        # Nested sub/mod.py
+        "test_pkg/sub/__init__.py": "",
+        "test_pkg/sub/mod.py": """
 from tests.test_reflection_nested_paths import Service
 
 class ClassA(Service):
     def do_something(self) -> str:
         return "nested"
-"""
-    )
+""",
+    }
 
-    sys.path.insert(0, str(tmp_path))
-
-    try:
+    with make_pkg(layout):
         config = ReflectionConfig()
         config.register_module(Service, "test_pkg", recursive=True)
 
         implementations = config.discover_implementations(Service)
 
-        # Should have both ClassA implementations with different paths
-        assert len(implementations) == 2
-
-        # Check that both are present with full paths
+        # Should have both ClassA implementations with different full paths
         # Top-level: "mod.ClassA"
         # Nested: "sub.mod.ClassA"
-        assert "mod.ClassA" in implementations
-        assert "sub.mod.ClassA" in implementations
+        assert set(implementations) == {"mod.ClassA", "sub.mod.ClassA"}
 
         # Verify they're different classes
         top_class = implementations["mod.ClassA"]
@@ -83,45 +65,28 @@ class ClassA(Service):
         assert top_instance.do_something() == "top_level"
         assert nested_instance.do_something() == "nested"
 
-    finally:
-        sys.path.remove(str(tmp_path))
-        modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_pkg")]
-        for m in modules_to_remove:
-            del sys.modules[m]
 
-
-def test_deeply_nested_submodules(tmp_path):
+def test_deeply_nested_submodules(make_pkg):
     """Test that deeply nested submodules preserve full path."""
     # Create package structure:
     # test_pkg/
     #   a/
     #     b/
     #       handler.py (contains Handler)
-
-    test_package_dir = tmp_path / "test_pkg"
-    test_package_dir.mkdir()
-    (test_package_dir / "__init__.py").write_text("")
-
-    a_dir = test_package_dir / "a"
-    a_dir.mkdir()
-    (a_dir / "__init__.py").write_text("")
-
-    b_dir = a_dir / "b"
-    b_dir.mkdir()
-    (b_dir / "__init__.py").write_text("")
-    (b_dir / "handler.py").write_text(
-        """
+    layout = {
+        "test_pkg/__init__.py": "",
+        "test_pkg/a/__init__.py": "",
+        "test_pkg/a/b/__init__.py": "",
+        "test_pkg/a/b/handler.py": """
 from tests.test_reflection_nested_paths import Service
 
 class Handler(Service):
     def do_something(self) -> str:
         return "deep"
-"""
-    )
+""",
+    }
 
-    sys.path.insert(0, str(tmp_path))
-
-    try:
+    with make_pkg(layout):
         config = ReflectionConfig()
         config.register_module(Service, "test_pkg", recursive=True)
 
@@ -134,14 +99,8 @@ class Handler(Service):
         instance = handler_class()
         assert instance.do_something() == "deep"
 
-    finally:
-        sys.path.remove(str(tmp_path))
-        modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_pkg")]
-        for m in modules_to_remove:
-            del sys.modules[m]
-
 
-def test_same_class_name_different_paths(tmp_path):
+def test_same_class_name_different_paths(make_pkg):
     """Test that same class name in different paths doesn't collide."""
     # Create package structure:
     # test_pkg/
@@ -150,57 +109,40 @@ def test_same_class_name_different_paths(tmp_path):
     #   api/
     #     handlers/
     #       create.py (contains CreateHandler)
-
-    test_package_dir = tmp_path / "test_pkg"
-    test_package_dir.mkdir()
-    (test_package_dir / "__init__.py").write_text("")
-
-    # First handlers/create.py
-    handlers1_dir = test_package_dir / "handlers"
-    handlers1_dir.mkdir()
-    (handlers1_dir / "__init__.py").write_text("")
-    (handlers1_dir / "create.py").write_text(
-        """
+    layout = {
+        "test_pkg/__init__.py": "",
+        # First handlers/create.py
+        "test_pkg/handlers/__init__.py": "",
+        "test_pkg/handlers/create.py": """
 from tests.test_reflection_nested_paths import Service
 
 class CreateHandler(Service):
     def do_something(self) -> str:
         return "handlers_create"
-"""
-    )
-
-    # Second api/handlers/create.py
-    api_dir = test_package_dir / "api"
-    api_dir.mkdir()
-    (api_dir / "__init__.py").write_text("")
-
-    handlers2_dir = api_dir / "handlers"
-    handlers2_dir.mkdir()
-    (handlers2_dir / "__init__.py").write_text("")
-    (handlers2_dir / "create.py").write_text(
-        """
+""",
+        # Second api/handlers/create.py
+        "test_pkg/api/__init__.py": "",
+        "test_pkg/api/handlers/__init__.py": "",
+        "test_pkg/api/handlers/create.py": """
 from tests.test_reflection_nested_paths import Service
 
 class CreateHandler(Service):
     def do_something(self) -> str:
         return "api_handlers_create"
-"""
-    )
+""",
+    }
 
-    sys.path.insert(0, str(tmp_path))
-
-    try:
+    with make_pkg(layout):
         config = ReflectionConfig()
         config.register_module(Service, "test_pkg", recursive=True)
 
         implementations = config.discover_implementations(Service)
 
-        # Should have both CreateHandler implementations with different paths
-        assert len(implementations) == 2
-
-        # Check that both are present with full paths
-        assert "handlers.create.CreateHandler" in implementations
-        assert "api.handlers.create.CreateHandler" in implementations
+        # Should have both CreateHandler implementations with different full paths
+        assert set(implementations) == {
+            "handlers.create.CreateHandler",
+            "api.handlers.create.CreateHandler",
+        }
 
         # Verify they're different classes
         handler1 = implementations["handlers.create.CreateHandler"]
@@ -212,9 +154,3 @@ class CreateHandler(Service):
         instance2 = handler2()
         assert instance1.do_something() == "handlers_create"
         assert instance2.do_something() == "api_handlers_create"
-
-    finally:
-        sys.path.remove(str(tmp_path))
-        modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_pkg")]
-        for m in modules_to_remove:
-            del sys.modules[m]
@@ -1,8 +1,6 @@
 """Tests for re-exported classes to ensure they're only discovered once."""
 
-import sys
 from abc import ABC, abstractmethod
-from pathlib import Path
 
 import pytest
 
@@ -17,46 +15,35 @@ class Service(ABC):
         pass
 
 
-def test_re_exported_class_only_discovered_once(tmp_path):
+def test_re_exported_class_only_discovered_once(make_pkg):
     """Test that a class imported and re-exported is only discovered once."""
     # Create package structure:
     # test_pkg/
     #   handlers/
     #     local.py (contains LocalHandler - defined here)
     #   exports.py (imports and re-exports LocalHandler)
-
-    test_package_dir = tmp_path / "test_pkg"
-    test_package_dir.mkdir()
-    (test_package_dir / "__init__.py").write_text("")
-
-    # handlers/local.py - defines LocalHandler
-    handlers_dir = test_package_dir / "handlers"
-    handlers_dir.mkdir()
-    (handlers_dir / "__init__.py").write_text("")
-    (handlers_dir / "local.py").write_text(
-        """
+    layout = {
+        "test_pkg/__init__.py": "",
+        # handlers/local.py - defines LocalHandler
+        "test_pkg/handlers/__init__.py": "",
+        "test_pkg/handlers/local.py": """
 from tests.test_reflection_re_export import Service
 
 class LocalHandler(Service):
     def do_something(self) -> str:
         return "local"
-"""
-    )
-
-    # exports.py - imports and re-exports LocalHandler
-    (test_package_dir / "exports.py").write_text(
-        """
+""",
+        # exports.py - imports and re-exports LocalHandler
+        "test_pkg/exports.py": """
 from tests.test_reflection_re_export import Service
 from test_pkg.handlers.local import LocalHandler
 
 # Re-export
 __all__ = ["LocalHandler"]
-"""
-    )
+""",
+    }
 
-    sys.path.insert(0, str(tmp_path))
-
-    try:
+    with make_pkg(layout):
         config = ReflectionConfig()
         config.register_module(Service, "test_pkg", recursive=True)
 
@@ -64,23 +51,15 @@ __all__ = ["LocalHandler"]
 
         # Should only discover LocalHandler once, from handlers.local where it's defined
         # Not from exports.py where it's re-exported
-        assert len(implementations) == 1
-        assert "handlers.local.LocalHandler" in implementations
-        assert "exports.LocalHandler" not in implementations
+        assert set(implementations) == {"handlers.local.LocalHandler"}
 
         # Verify it works
         handler_class = implementations["handlers.local.LocalHandler"]
         instance = handler_class()
         assert instance.do_something() == "local"
 
-    finally:
-        sys.path.remove(str(tmp_path))
-        modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_pkg")]
-        for m in modules_to_remove:
-            del sys.modules[m]
-
 
-def test_multiple_re_exports_only_discovered_once(tmp_path):
+def test_multiple_re_exports_only_discovered_once(make_pkg):
     """Test that a class re-exported in multiple modules is only discovered once."""
     # Create package structure:
     # test_pkg/
@@ -90,68 +69,41 @@ def test_multiple_re_exports_only_discovered_once(tmp_path):
     #     __init__.py (re-exports Service)
     #   handlers/
     #     __init__.py (re-exports Service)
-
-    test_package_dir = tmp_path / "test_pkg"
-    test_package_dir.mkdir()
-    (test_package_dir / "__init__.py").write_text("")
-
-    # core/service.py - defines Service
-    core_dir = test_package_dir / "core"
-    core_dir.mkdir()
-    (core_dir / "__init__.py").write_text("")
-    (core_dir / "service.py").write_text(
-        """
+    layout = {
+        "test_pkg/__init__.py": "",
+        # core/service.py - defines Service
+        "test_pkg/core/__init__.py": "",
+        "test_pkg/core/service.py": """
 from tests.test_reflection_re_export import Service
 
 class Service(Service):
     def do_something(self) -> str:
         return "service"
-"""
-    )
-
-    # api/__init__.py - re-exports Service
-    api_dir = test_package_dir / "api"
-    api_dir.mkdir()
-    (api_dir / "__init__.py").write_text(
-        """
+""",
+        # api/__init__.py - re-exports Service
+        "test_pkg/api/__init__.py": """
 from test_pkg.core.service import Service
 
 __all__ = ["Service"]
-"""
-    )
-
-    # handlers/__init__.py - also re-exports Service
-    handlers_dir = test_package_dir / "handlers"
-    handlers_dir.mkdir()
-    (handlers_dir / "__init__.py").write_text(
-        """
+""",
+        # handlers/__init__.py - also re-exports Service
+        "test_pkg/handlers/__init__.py": """
 from test_pkg.core.service import Service
 
 __all__ = ["Service"]
-"""
-    )
+""",
+    }
 
-    sys.path.insert(0, str(tmp_path))
-
-    try:
+    with make_pkg(layout):
         config = ReflectionConfig()
         config.register_module(Service, "test_pkg", recursive=True)
 
         implementations = config.discover_implementations(Service)
 
         # Should only discover Service once, from core.service where it's defined
-        assert len(implementations) == 1
-        assert "core.service.Service" in implementations
-        assert "api.Service" not in implementations
-        assert "handlers.Service" not in implementations
+        assert set(implementations) == {"core.service.Service"}
 
         # Verify it works
         service_class = implementations["core.service.Service"]
         instance = service_class()
         assert instance.do_something() == "service"
-
-    finally:
-        sys.path.remove(str(tmp_path))
-        modules_to_remove = [m for m in sys.modules.keys() if m.startswith("test_pkg")]
-        for m in modules_to_remove:
-            del sys.modules[m]
@@ -1,13 +1,29 @@
 """Tests for SerDe interface and dependency injection integration."""
 
 import json
-from datetime import datetime
+import math
+import pickle
+import sys
+import weakref
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, time, timezone
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from pyiv import ChainType, Config, get_injector
-from pyiv.serde import Base64SerDe, JSONSerDe, NoOpSerDe, PickleSerDe, SerDe, XMLSerDe, YAMLSerDe
+from pyiv import ChainType, Config, SingletonType, get_injector
+from pyiv.serde import (
+    Base64SerDe,
+    JSONBase64SerDe,
+    JSONSerDe,
+    NoOpSerDe,
+    PickleSerDe,
+    SerDe,
+    XMLSerDe,
+    YAMLSerDe,
+)
+from pyiv.serde.encodings import ORJSON_AVAILABLE, _json_dumps, _json_loads
 
 
 class CustomJSONSerDe(JSONSerDe):
@@ -20,6 +36,12 @@ class CustomJSONSerDe(JSONSerDe):
         return super()._default_serializer(obj)
 
 
+class TableJSONSerDe(JSONSerDe):
+    """Custom JSON SerDe that changes date formatting through the converter table."""
+
+    _default_handlers = {datetime: lambda obj: obj.strftime("%Y-%m-%d %H:%M:%S")}
+
+
 class TestSerDeInterface:
     """Tests for the SerDe base interface."""
 
@@ -34,6 +56,14 @@ class TestSerDeInterface:
         assert serde.handler_type == "json"
         assert serde.chain_type == ChainType.ENCODING
 
+    def test_builtin_serdes_can_be_patched_and_weakly_referenced(self):
+        """Test built-in SerDe instances support patch.object and weakref."""
+        for serde_class in (JSONSerDe, PickleSerDe, Base64SerDe, XMLSerDe, NoOpSerDe):
+            serde = serde_class()
+            with patch.object(serde, "serialize", return_value="patched"):
+                assert serde.serialize({"key": "value"}) == "patched"
+            assert weakref.ref(serde)() is serde
+
     def test_serde_serialize_deserialize(self):
         """Test basic serialize/deserialize functionality."""
         serde = JSONSerDe()
@@ -88,6 +118,80 @@ class TestSerDeImplementations:
         deserialized = serde.deserialize(serialized)
         assert deserialized == data
 
+    def test_json_serde_matches_stdlib_json(self):
+        """Test JSONSerDe encodes the values the json module accepts the same way."""
+        serde = JSONSerDe()
+        data = {1: "int key", "big": 2**70, "when": datetime(2024, 1, 1, 12, 0, 0)}
+
+        deserialized = serde.deserialize(serde.serialize(data))
+
+        assert deserialized == {"1": "int key", "big": 2**70, "when": "2024-01-01T12:00:00"}
+
+    def test_json_serde_subclass_without_super_init(self):
+        """Test a subclass whose __init__ skips super().__init__() can serialize."""
+
+        class PrefixedJSONSerDe(JSONSerDe):
+            def __init__(self, prefix: str = ">"):
+                self.prefix = prefix
+
+        serde = PrefixedJSONSerDe()
+
+        assert serde.deserialize(serde.serialize({"when": datetime(2024, 1, 1)})) == {
+            "when": "2024-01-01T00:00:00"
+        }
+        assert serde.prefix == ">"
+
+    def test_json_serde_non_finite_floats(self):
+        """Test NaN and infinities round-trip instead of turning into null."""
+        serde = JSONSerDe()
+        data = {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "none": None}
+
+        serialized = serde.serialize(data)
+        deserialized = serde.deserialize(serialized)
+
+        assert serialized == json.dumps(data)
+        assert math.isnan(deserialized["nan"])
+        assert deserialized["inf"] == [float("inf"), -float("inf")]
+        assert deserialized["none"] is None
+
+    def test_json_serde_null_with_finite_floats(self):
+        """Test payloads with null but only finite floats keep the fast encoder's output."""
+        serde = JSONSerDe()
+        data = {"none": None, "values": [1.5, (2.5, {"x": None})]}
+
+        serialized = serde.serialize(data)
+
+        if ORJSON_AVAILABLE:
+            assert serialized == '{"none":null,"values":[1.5,[2.5,{"x":null}]]}'
+        assert serde.deserialize(serialized) == {"none": None, "values": [1.5, [2.5, {"x": None}]]}
+
+    def test_json_serde_binds_codec_once(self):
+        """Test the JSON encoder and decoder are resolved at import time."""
+        if ORJSON_AVAILABLE:
+            import orjson
+
+            assert _json_dumps is orjson.dumps
+            assert _json_loads is orjson.loads
+        else:
+            assert _json_dumps is json.dumps
+            assert _json_loads is json.loads
+
+    def test_json_serde_dates_and_times(self):
+        """Test datetimes, dates and times are written as ISO 8601 strings."""
+        serde = JSONSerDe()
+        values = [
+            datetime(2024, 1, 1, 12, 0, 0, 123),
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            date(2024, 2, 3),
+            time(1, 2, 3),
+        ]
+
+        deserialized = serde.deserialize(serde.serialize(values))
+
+        assert deserialized == [value.isoformat() for value in values]
+        assert CustomJSONSerDe().serialize([values[0]]) == '["2024-01-01 12:00:00"]'
+        assert TableJSONSerDe().serialize([values[0]]) == '["2024-01-01 12:00:00"]'
+
     def test_noop_serde(self):
         """Test NoOpSerDe."""
         serde = NoOpSerDe()
@@ -106,6 +210,19 @@ class TestSerDeImplementations:
         deserialized = serde.deserialize(serialized)
         assert deserialized == data
 
+    def test_pickle_serde_out_of_band_buffers(self):
+        """Test PickleSerDe passes PickleBuffer payloads out of band."""
+        serde = PickleSerDe()
+        payload = bytearray(b"x" * 1024)
+        buffers: list = []
+
+        serialized = serde.serialize({"payload": pickle.PickleBuffer(payload)}, buffers=buffers)
+
+        assert len(buffers) == 1
+        assert len(serialized) < len(payload)
+        deserialized = serde.deserialize(serialized, buffers=buffers)
+        assert bytes(deserialized["payload"]) == bytes(payload)
+
     def test_base64_serde(self):
         """Test Base64SerDe."""
         serde = Base64SerDe()
@@ -125,6 +242,61 @@ class TestSerDeImplementations:
         deserialized = serde.deserialize(serialized)
         assert isinstance(deserialized, dict)
 
+    def test_json_base64_serde(self):
+        """Test JSONBase64SerDe matches chaining JSONSerDe and Base64SerDe."""
+        serde = JSONBase64SerDe()
+        data = {"key": "value", "when": datetime(2024, 1, 1, 12, 0, 0)}
+
+        serialized = serde.serialize(data)
+
+        chained = Base64SerDe().serialize(JSONSerDe().serialize(data))
+        assert serialized == chained
+        assert serde.handler_type == "json-b64"
+        assert serde.deserialize(serialized) == {"key": "value", "when": "2024-01-01T12:00:00"}
+        assert serde.deserialize(serialized.encode("utf-8"))["key"] == "value"
+        assert not isinstance(serde, JSONSerDe)
+
+    def test_json_base64_serde_custom_json_step(self):
+        """Test JSONBase64SerDe delegates the JSON step to the SerDe it is given."""
+        serde = JSONBase64SerDe(CustomJSONSerDe())
+        data = {"timestamp": datetime(2024, 1, 1, 12, 0, 0)}
+
+        serialized = serde.serialize(data)
+
+        assert serialized == Base64SerDe().serialize(CustomJSONSerDe().serialize(data))
+        assert serde.deserialize(serialized) == {"timestamp": "2024-01-01 12:00:00"}
+
+    def test_xml_serde_nested_and_escaped(self):
+        """Test XMLSerDe output for nested, empty and escaped values."""
+        serde = XMLSerDe()
+        data = {"a": {"b": "x<y"}, "list": [1, {"c": "&"}], "empty": "", "none": {}}
+
+        serialized = serde.serialize(data)
+
+        assert serialized == (
+            "<root><a><b>x&lt;y</b></a><list><item>1</item><item><c>&amp;</c></item></list>"
+            "<empty /><none /></root>"
+        )
+        assert serde.deserialize(serialized)["list"] == {"items": ["1", {"c": "&"}]}
+
+    def test_xml_serde_namespaced_keys(self):
+        """Test namespaced keys are written as ElementTree writes them."""
+        serde = XMLSerDe()
+        data = {"plain": "0", "nested": {"{http://x}a": "1"}, "list": [{"{http://x}b": "2"}]}
+
+        serialized = serde.serialize(data)
+
+        root = ET.Element("root")
+        ET.SubElement(root, "plain").text = "0"
+        ET.SubElement(ET.SubElement(root, "nested"), "{http://x}a").text = "1"
+        item = ET.SubElement(ET.SubElement(root, "list"), "item")
+        ET.SubElement(item, "{http://x}b").text = "2"
+        assert serialized == ET.tostring(root, encoding="unicode")
+        assert serde.serialize({"{http://x}a": "1"}) == (
+            '<root xmlns:ns0="http://x"><ns0:a>1</ns0:a></root>'
+        )
+        assert serde.deserialize(serialized)["nested"] == {"{http://x}a": "1"}
+
     def test_custom_json_serde(self):
         """Test custom JSON SerDe with different date formatting."""
         serde = CustomJSONSerDe()
@@ -137,6 +309,16 @@ class TestSerDeImplementations:
         standard_serialized = standard_serde.serialize(data)
         assert serialized != standard_serialized
 
+    def test_custom_json_serde_handler_table(self):
+        """Test custom date formatting supplied through _default_handlers."""
+        serde = TableJSONSerDe()
+        data = {"timestamp": datetime(2024, 1, 1, 12, 0, 0)}
+
+        serialized = serde.serialize(data)
+
+        assert "2024-01-01 12:00:00" in serialized
+        assert serialized == CustomJSONSerDe().serialize(data)
+
 
 class TestChainHandlerConfigRegistration:
     """Tests for chain handler registration in Config."""
@@ -187,6 +369,34 @@ class TestChainHandlerConfigRegistration:
         assert config.has_chain_handler_registration_by_name(ChainType.ENCODING, "json-input")
         assert config.has_chain_handler_registration_by_name(ChainType.ENCODING, "json-output")
 
+    def test_register_chain_handler_singleton_types(self):
+        """Test that singleton types are tracked per registration, by type and by name."""
+
+        class MyConfig(Config):
+            def configure(self):
+                self.register_chain_handler(ChainType.ENCODING, "json", JSONSerDe)
+                self.register_chain_handler_by_name(
+                    ChainType.ENCODING,
+                    "json",
+                    JSONSerDe,
+                    "json",
+                    singleton_type=SingletonType.NONE,
+                )
+                self.register_chain_handler(ChainType.ENCODING, "pickle", PickleSerDe)
+                # Re-registering replaces the earlier singleton configuration
+                self.register_chain_handler(
+                    ChainType.ENCODING, "pickle", PickleSerDe, singleton_type=SingletonType.NONE
+                )
+
+        injector = get_injector(MyConfig)
+
+        by_type = injector.inject_chain_handler(ChainType.ENCODING, "json")
+        assert injector.inject_chain_handler(ChainType.ENCODING, "json") is by_type
+        by_name = injector.inject_chain_handler_by_name(ChainType.ENCODING, "json")
+        assert injector.inject_chain_handler_by_name(ChainType.ENCODING, "json") is not by_name
+        pickle_serde = injector.inject_chain_handler(ChainType.ENCODING, "pickle")
+        assert injector.inject_chain_handler(ChainType.ENCODING, "pickle") is not pickle_serde
+
     def test_register_chain_handler_instance(self):
         """Test registering a pre-created chain handler instance."""
 
@@ -223,6 +433,52 @@ class TestChainHandlerConfigRegistration:
         with pytest.raises(ValueError, match="name must be a non-empty string"):
             config.register_chain_handler_by_name(ChainType.ENCODING, "", JSONSerDe, "json")
 
+    def test_register_chain_handler_interns_keys(self):
+        """Test that handler types and names built at runtime are stored interned."""
+
+        class MyConfig(Config):
+            def configure(self):
+                pass
+
+        config = MyConfig()
+        handler_type = "".join(["js", "on"])
+        name = "".join(["json-", "input"])
+        config.register_chain_handler(ChainType.ENCODING, handler_type, JSONSerDe)
+        config.register_chain_handler_by_name(ChainType.ENCODING, name, JSONSerDe, handler_type)
+
+        assert all(key[1] is sys.intern("json") for key in config._chain_by_type)
+        assert all(key[1] is sys.intern("json-input") for key in config._chain_by_name)
+
+    def test_register_chain_handler_instance_interns_handler_type(self):
+        """Test that an instance's runtime-built handler type is stored interned."""
+
+        class RuntimeTypeSerDe(JSONSerDe):
+            handler_type = "".join(["json-", "runtime"])
+
+        config = Config()
+        config.register_chain_handler_instance(ChainType.ENCODING, "runtime", RuntimeTypeSerDe())
+
+        assert (ChainType.ENCODING, "json-runtime") in config._chain_by_type
+        assert all(key[1] is sys.intern("json-runtime") for key in config._chain_by_type)
+
+    def test_register_chain_handlers_validates_before_registering(self):
+        """Test that a bad entry in a bulk registration registers nothing."""
+
+        class MyConfig(Config):
+            def configure(self):
+                pass
+
+        config = MyConfig()
+
+        with pytest.raises(TypeError, match="handler_class must be a subclass of ChainHandler"):
+            config.register_chain_handlers(
+                {
+                    (ChainType.ENCODING, "json"): JSONSerDe,
+                    (ChainType.ENCODING, "bad"): str,  # type: ignore[dict-item]
+                }
+            )
+        assert not config.has_chain_handler_registration(ChainType.ENCODING, "json")
+
 
 class TestChainHandlerInjection:
     """Tests for chain handler injection via Injector."""
@@ -290,6 +546,28 @@ class TestChainHandlerInjection:
         # Should be the same instance (singleton)
         assert serde1 is serde2
 
+    def test_inject_chain_handler_singleton_per_injector(self):
+        """Test that chain handler singletons are cached per injector, by type and by name."""
+
+        class MyConfig(Config):
+            def configure(self):
+                self.register_chain_handler(ChainType.ENCODING, "json", JSONSerDe)
+                self.register_chain_handler_by_name(
+                    ChainType.ENCODING, "json", CustomJSONSerDe, "json"
+                )
+
+        injector = get_injector(MyConfig)
+        by_type = injector.inject_chain_handler(ChainType.ENCODING, "json")
+        by_name = injector.inject_chain_handler_by_name(ChainType.ENCODING, "json")
+
+        # A name equal to a handler type does not share the type's cached instance
+        assert type(by_type) is JSONSerDe
+        assert isinstance(by_name, CustomJSONSerDe)
+        assert injector.inject_chain_handler_by_name(ChainType.ENCODING, "json") is by_name
+
+        other = get_injector(MyConfig)
+        assert other.inject_chain_handler(ChainType.ENCODING, "json") is not by_type
+
     def test_inject_chain_handler_precreated_instance(self):
         """Test injecting a pre-created chain handler instance."""
 
@@ -350,14 +628,44 @@ class TestChainHandlerIntegration:
         # JSON may include spaces, so check content rather than exact format
         assert '"key"' in result and '"value"' in result
 
+    def test_warm_chain_handlers(self):
+        """Test get_injector can create singleton chain handlers up front."""
+        created = []
+
+        class CountingSerDe(JSONSerDe):
+            def __init__(self):
+                super().__init__()
+                created.append(self)
+
+        class MyConfig(Config):
+            def configure(self):
+                self.register_chain_handler(ChainType.ENCODING, "json", CountingSerDe)
+                self.register_chain_handler_by_name(
+                    ChainType.ENCODING, "json-input", CountingSerDe, "json"
+                )
+                self.register_chain_handler(
+                    ChainType.ENCODING, "json-new", CountingSerDe, singleton_type=SingletonType.NONE
+                )
+
+        injector = get_injector(MyConfig, warm_chain_handlers=True)
+        assert len(created) == 2
+
+        assert injector.inject_chain_handler(ChainType.ENCODING, "json") is created[0]
+        assert injector.inject_chain_handler_by_name(ChainType.ENCODING, "json-input") is created[1]
+        assert len(created) == 2
+
     def test_multiple_encoding_types(self):
         """Test registering and injecting multiple encoding types."""
 
         class MyConfig(Config):
             def configure(self):
-                self.register_chain_handler(ChainType.ENCODING, "json", JSONSerDe)
-                self.register_chain_handler(ChainType.ENCODING, "pickle", PickleSerDe)
-                self.register_chain_handler(ChainType.ENCODING, "base64", Base64SerDe)
+                self.register_chain_handlers(
+                    {
+                        (ChainType.ENCODING, "json"): JSONSerDe,
+                        (ChainType.ENCODING, "pickle"): PickleSerDe,
+                        (ChainType.ENCODING, "base64"): Base64SerDe,
+                    }
+                )
 
         injector = get_injector(MyConfig)
         json_serde = injector.inject_chain_handler(ChainType.ENCODING, "json")
@@ -1,11 +1,13 @@
 """Tests for singleton support."""
 
 import threading
+import time
 from abc import ABC, abstractmethod
 
 import pytest
 
 from pyiv import Config, GlobalSingletonRegistry, Injector, SingletonType, get_injector
+from pyiv.scope import SingletonScope
 
 
 class Database(ABC):
@@ -106,6 +108,37 @@ class TestPerInjectorSingleton:
         assert db2.host == "first"  # Original kwargs preserved
         assert db2.port == 1111
 
+    def test_singleton_thread_safe(self):
+        """Test that threads racing on one injector all get the same singleton."""
+
+        class SlowPostgreSQL(PostgreSQL):
+            def __init__(self):
+                super().__init__()
+                time.sleep(0.01)  # Let the other threads start their own construction
+
+        class SingletonConfig(Config):
+            def configure(self):
+                self.register(Database, SlowPostgreSQL, singleton_type=SingletonType.SINGLETON)
+
+        injector = get_injector(SingletonConfig)
+        instances = []
+        lock = threading.Lock()
+
+        def get_instance():
+            db = injector.inject(Database)
+            with lock:
+                instances.append(db)
+
+        threads = [threading.Thread(target=get_instance) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(instances) == 5
+        assert all(instance is instances[0] for instance in instances)
+        assert injector.inject(Database) is instances[0]
+
 
 class TestGlobalSingleton:
     """Test global singleton behavior."""
@@ -185,6 +218,26 @@ class TestGlobalSingleton:
         assert db3 is db2
 
 
+class TestExplicitScope:
+    """Test registrations with an explicit scope."""
+
+    def test_singleton_scope_returns_same_instance(self):
+        """Test that scope=SingletonScope() caches the instance per injector."""
+
+        class ScopeConfig(Config):
+            def configure(self):
+                self.register(Database, PostgreSQL, scope=SingletonScope())
+
+        injector = get_injector(ScopeConfig)
+
+        db1 = injector.inject(Database, host="first")
+        db2 = injector.inject(Database)
+
+        assert isinstance(db1, PostgreSQL)
+        assert db2 is db1
+        assert db1.host == "first"
+
+
 class TestNoSingleton:
     """Test NONE singleton type (default behavior)."""
 
@@ -273,3 +326,15 @@ class TestGlobalSingletonRegistry:
         GlobalSingletonRegistry.clear()
         assert not GlobalSingletonRegistry.has(TestClass)
         assert GlobalSingletonRegistry.get(TestClass) is None
+
+    def test_setdefault_keeps_first_instance(self):
+        """Test setdefault only stores an instance for an unregistered key."""
+        GlobalSingletonRegistry.clear()
+
+        class TestClass:
+            pass
+
+        first = TestClass()
+        assert GlobalSingletonRegistry.setdefault(TestClass, first) is first
+        assert GlobalSingletonRegistry.setdefault(TestClass, TestClass()) is first
+        assert GlobalSingletonRegistry.get(TestClass) is first